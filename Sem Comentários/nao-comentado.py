@@ -1,26 +1,596 @@
-from collections import deque, defaultdict
-from typing import List, Tuple
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from heapq import heapify, heappop, heappush
+from itertools import chain, islice, repeat
+from collections import deque, defaultdict, OrderedDict
+from contextlib import closing, contextmanager, ExitStack
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+class RastreadorPaginacao:
+    
+    def inicio(self, algoritmo: "AlgoritmoPaginacao"):
+        pass
+    
+    def acerto(self, algoritmo: "AlgoritmoPaginacao", passo: int, pagina: int):
+        pass
+    
+    def falta(self, algoritmo: "AlgoritmoPaginacao", passo: int, pagina: int):
+        pass
+    
+    def remocao(self, algoritmo: "AlgoritmoPaginacao", passo: int, pagina: int, quadro: int):
+        pass
+    
+    def insercao(self, algoritmo: "AlgoritmoPaginacao", passo: int, pagina: int, quadro: int):
+        pass
+
+class RastreadorConsole(RastreadorPaginacao):
+    
+    def __init__(self, arquivo=None):
+        self.arquivo = arquivo
+        self.tempo_ultimo_uso = {}
+    
+    def inicio(self, algoritmo):
+        self.tempo_ultimo_uso = {}
+        print(f"\n--- Iniciando execução {algoritmo.NOME} ---", file=self.arquivo)
+    
+    def acerto(self, algoritmo, passo, pagina):
+        print(f"\nPasso {passo}: Acessando página {pagina}", file=self.arquivo)
+        print(f"  ✓ Página {pagina} já está na memória (HIT)", file=self.arquivo)
+        if algoritmo.USA_RECENCIA:
+            self.tempo_ultimo_uso[pagina] = passo
+            print(f"  → Atualizando timestamp da página {pagina} para {passo}", file=self.arquivo)
+        print(f"  Estado da memória: {algoritmo.quadros_memoria}", file=self.arquivo)
+    
+    def falta(self, algoritmo, passo, pagina):
+        print(f"\nPasso {passo}: Acessando página {pagina}", file=self.arquivo)
+        print(f"  ✗ Page Fault! Página {pagina} não está na memória", file=self.arquivo)
+    
+    def remocao(self, algoritmo, passo, pagina, quadro):
+        if algoritmo.USA_RECENCIA:
+            tempo_removido = self.tempo_ultimo_uso.pop(pagina, 0)
+            print(f"  → Removendo página {pagina} do quadro {quadro} ({algoritmo.MOTIVO_REMOCAO}, timestamp: {tempo_removido})", file=self.arquivo)
+        else:
+            print(f"  → Removendo página {pagina} do quadro {quadro} ({algoritmo.MOTIVO_REMOCAO})", file=self.arquivo)
+    
+    def insercao(self, algoritmo, passo, pagina, quadro):
+        print(f"  → Adicionando página {pagina} no quadro {quadro}", file=self.arquivo)
+        print(f"  Estado da memória: {algoritmo.quadros_memoria}", file=self.arquivo)
+        if algoritmo.USA_RECENCIA:
+            self.tempo_ultimo_uso[pagina] = passo
+            print(f"  Timestamps: {self.tempo_ultimo_uso}", file=self.arquivo)
+
+class HistoricoCompacto:
+    
+    SEM_PAGINA = -1
+    
+    def __init__(self, intervalo_checkpoint: int = 256):
+        if intervalo_checkpoint < 1:
+            raise ValueError("intervalo_checkpoint deve ser pelo menos 1")
+        self.intervalo_checkpoint = intervalo_checkpoint
+        self.passos = array("q")
+        self.quadros = array("i")
+        self.removidas = array("q")
+        self.inseridas = array("q")
+        self.checkpoints = []
+    
+    def registrar(self, passo: int, quadro: int, removida: int, inserida: int,
+                  quadros_memoria: List[int]):
+        if len(self.passos) % self.intervalo_checkpoint == 0:
+            try:
+                checkpoint = array("q", quadros_memoria)
+            except OverflowError:
+                checkpoint = list(quadros_memoria)
+            self.checkpoints.append(checkpoint)
+        self.passos.append(passo)
+        self.quadros.append(quadro)
+        try:
+            self.removidas.append(removida)
+        except OverflowError:
+            self.removidas = list(self.removidas)
+            self.removidas.append(removida)
+        try:
+            self.inseridas.append(inserida)
+        except OverflowError:
+            self.inseridas = list(self.inseridas)
+            self.inseridas.append(inserida)
+    
+    def __len__(self) -> int:
+        return len(self.passos)
+    
+    def __getitem__(self, indice: int) -> List[int]:
+        total = len(self.passos)
+        if indice < 0:
+            indice += total
+        if not 0 <= indice < total:
+            raise IndexError("índice fora do histórico")
+        
+        inicio = indice - indice % self.intervalo_checkpoint
+        estado = list(self.checkpoints[inicio // self.intervalo_checkpoint])
+        quadros = self.quadros
+        inseridas = self.inseridas
+        for k in range(inicio + 1, indice + 1):
+            quadro = quadros[k]
+            if quadro == len(estado):
+                estado.append(inseridas[k])
+            else:
+                estado[quadro] = inseridas[k]
+        return estado
+    
+    def __iter__(self) -> Iterator[List[int]]:
+        estado = []
+        for quadro, inserida in zip(self.quadros, self.inseridas):
+            if quadro == len(estado):
+                estado.append(inserida)
+            else:
+                estado[quadro] = inserida
+            yield estado.copy()
+    
+    def delta(self, indice: int) -> Tuple[int, int, int, int]:
+        return (self.passos[indice], self.quadros[indice],
+                self.removidas[indice], self.inseridas[indice])
+    
+    def estado_no_passo(self, passo: int) -> List[int]:
+        indice = bisect_right(self.passos, passo) - 1
+        if indice < 0:
+            return []
+        return self[indice]
+
+class MetricasPaginacao:
+    
+    def __init__(self):
+        self.acertos = 0
+        self.faltas = 0
+        self.faltas_compulsorias = 0
+        self.faltas_capacidade = 0
+        self.remocoes_por_pagina = defaultdict(int)
+        self.histograma_residencia = [0]
+        self.tempo_busca_ns = 0
+        self.tempo_escolha_vitima_ns = 0
+        self.tempo_atualizacao_ns = 0
+        self._paginas_vistas = set()
+        self._passo_insercao = {}
+    
+    def registrar_residencia(self, pagina: int, passo: int):
+        self.remocoes_por_pagina[pagina] += 1
+        faixa = (passo - self._passo_insercao.pop(pagina)).bit_length()
+        if faixa >= len(self.histograma_residencia):
+            self.histograma_residencia.extend([0] * (faixa + 1 - len(self.histograma_residencia)))
+        self.histograma_residencia[faixa] += 1
+    
+    def para_dict(self) -> dict:
+        acessos = self.acertos + self.faltas
+        residencia = {}
+        for faixa, quantidade in enumerate(self.histograma_residencia):
+            if quantidade:
+                inicio = 1 << (faixa - 1) if faixa else 0
+                residencia[f"{inicio}-{max(inicio, (1 << faixa) - 1)}"] = quantidade
+        return {
+            "acessos": acessos,
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "taxa_acertos": self.acertos / acessos if acessos else 0.0,
+            "faltas_compulsorias": self.faltas_compulsorias,
+            "faltas_capacidade": self.faltas_capacidade,
+            "remocoes": sum(self.remocoes_por_pagina.values()),
+            "remocoes_por_pagina": {str(pagina): vezes for pagina, vezes in self.remocoes_por_pagina.items()},
+            "histograma_residencia": residencia,
+            "tempo_busca_ns": self.tempo_busca_ns,
+            "tempo_escolha_vitima_ns": self.tempo_escolha_vitima_ns,
+            "tempo_atualizacao_ns": self.tempo_atualizacao_ns,
+        }
+    
+    def para_json(self, **opcoes_json) -> str:
+        import json
+        return json.dumps(self.para_dict(), **opcoes_json)
+
+class RegistroAcessos:
+    
+    def __init__(self, registrar_removidas: bool = False):
+        self.bits = bytearray()
+        self.removidas = array("q") if registrar_removidas else None
+        self.total_acessos = 0
+    
+    def marcar_falta(self, passo: int, removida: int):
+        indice = passo - 1
+        byte = indice >> 3
+        bits = self.bits
+        if byte >= len(bits):
+            bits.extend(bytes(byte + 1 - len(bits)))
+        bits[byte] |= 1 << (indice & 7)
+        if self.removidas is not None:
+            try:
+                self.removidas.append(removida)
+            except OverflowError:
+                self.removidas = list(self.removidas)
+                self.removidas.append(removida)
+    
+    def finalizar(self, total_acessos: int):
+        self.total_acessos = total_acessos
+        tamanho = (total_acessos + 7) >> 3
+        if len(self.bits) < tamanho:
+            self.bits.extend(bytes(tamanho - len(self.bits)))
+    
+    def __len__(self) -> int:
+        return self.total_acessos
+    
+    def foi_falta(self, indice: int) -> bool:
+        if not 0 <= indice < self.total_acessos:
+            raise IndexError("índice fora do registro")
+        return bool(self.bits[indice >> 3] >> (indice & 7) & 1)
+    
+    def contar_faltas(self) -> int:
+        return int.from_bytes(self.bits, "little").bit_count()
+    
+    def para_numpy(self):
+        import numpy as np
+        
+        return np.unpackbits(np.frombuffer(self.bits, dtype=np.uint8),
+                             count=self.total_acessos, bitorder="little").view(bool)
 
 class AlgoritmoPaginacao:
     
-    def __init__(self, numero_quadros: int):
+    NOME = ""
+    MOTIVO_REMOCAO = ""
+    USA_RECENCIA = False
+    PRECISA_FUTURO = False
+    VERSAO = 1
+    
+    def __init__(self, numero_quadros: int, rastreador: Optional[RastreadorPaginacao] = None,
+                 registrar_historico: bool = True, coletar_metricas: bool = False,
+                 registrar_acessos: bool = False, registrar_removidas: bool = False):
         self.numero_quadros = numero_quadros
+        self.rastreador = rastreador
+        self.registrar_historico = registrar_historico
+        self.coletar_metricas = coletar_metricas
+        self.metricas = MetricasPaginacao() if coletar_metricas else None
+        self.registrar_acessos = registrar_acessos
+        self.registrar_removidas = registrar_removidas
+        self.registro_acessos = RegistroAcessos(registrar_removidas) if registrar_acessos else None
         self.quadros_memoria = []
+        self.mapa_quadros = {}
         self.numero_paginas_faltantes = 0
-        self.historico_estado = []
+        self.passo = 0
+        self.historico_estado = self._novo_historico()
+        self.iniciar_politica()
     
     def resetar(self):
         self.quadros_memoria = []
+        self.mapa_quadros = {}
         self.numero_paginas_faltantes = 0
-        self.historico_estado = []
+        self.passo = 0
+        self.historico_estado = self._novo_historico()
+        if self.coletar_metricas:
+            self.metricas = MetricasPaginacao()
+        if self.registrar_acessos:
+            self.registro_acessos = RegistroAcessos(self.registrar_removidas)
+        self.iniciar_politica()
+    
+    def iniciar_politica(self):
+        pass
+    
+    def preparar(self, sequencia_paginas: Iterable[int]) -> Iterable[int]:
+        return sequencia_paginas
+    
+    def ao_acertar(self, pagina: int):
+        pass
+    
+    def escolher_vitima(self, pagina: int) -> int:
+        raise NotImplementedError
+    
+    def ao_inserir(self, pagina: int):
+        pass
+    
+    def ao_acertos_repetidos(self, pagina: int, vezes: int):
+        self.ao_acertar(pagina)
+    
+    def ao_renumerar_quadro(self, origem: int, destino: int):
+        pass
+    
+    def ao_reduzir_quadros(self):
+        pass
+    
+    def executar(self, sequencia_paginas: Iterable[int]) -> int:
+        if (isinstance(sequencia_paginas, TraceCompacto) and sequencia_paginas.repeticoes is not None
+                and self.rastreador is None and not self.coletar_metricas):
+            return self.executar_corridas(sequencia_paginas.paginas, sequencia_paginas.repeticoes)
+        
+        self.resetar()
+        return self._alimentar(self.preparar(sequencia_paginas))
+    
+    def acessar(self, pagina: int) -> Tuple[bool, Optional[int]]:
+        self._verificar_incremental()
+        if self.metricas is not None:
+            faltas_antes = self.numero_paginas_faltantes
+            self._executar_instrumentado((pagina,))
+            if self.numero_paginas_faltantes == faltas_antes:
+                return True, None
+            removida = self._ultima_removida
+            return False, None if removida == HistoricoCompacto.SEM_PAGINA else removida
+        
+        self.passo += 1
+        idx = self.passo
+        rastreador = self.rastreador
+        registro = self.registro_acessos
+        if rastreador is not None and idx == 1:
+            rastreador.inicio(self)
+        
+        if pagina in self.mapa_quadros:
+            self.ao_acertar(pagina)
+            if rastreador is not None:
+                rastreador.acerto(self, idx, pagina)
+            if registro is not None:
+                registro.finalizar(idx)
+            return True, None
+        
+        self.numero_paginas_faltantes += 1
+        if rastreador is not None:
+            rastreador.falta(self, idx, pagina)
+        if len(self.quadros_memoria) < self.numero_quadros:
+            quadro = self._ocupar_quadro_livre(pagina)
+            pagina_removida = None
+        else:
+            pagina_removida = self.escolher_vitima(pagina)
+            quadro = self._substituir_pagina(pagina_removida, pagina)
+            if rastreador is not None:
+                rastreador.remocao(self, idx, pagina_removida, quadro)
+        self.ao_inserir(pagina)
+        
+        if rastreador is not None:
+            rastreador.insercao(self, idx, pagina, quadro)
+        removida = HistoricoCompacto.SEM_PAGINA if pagina_removida is None else pagina_removida
+        if self.registrar_historico:
+            self.historico_estado.registrar(idx, quadro, removida, pagina, self.quadros_memoria)
+        if registro is not None:
+            registro.marcar_falta(idx, removida)
+            registro.finalizar(idx)
+        return False, pagina_removida
     
-    def exibir_resultado(self, pagina_procurada: int, sequencia: List[int]):
-        print(f"\nSequência de páginas: {sequencia}")
+    def alimentar(self, paginas: Iterable[int]) -> int:
+        self._verificar_incremental()
+        return self._alimentar(paginas)
+    
+    def reduzir_quadros(self, numero_quadros: int):
+        self._verificar_incremental()
+        if self.registrar_historico:
+            raise ValueError("reduzir_quadros exige registrar_historico=False")
+        if numero_quadros < 1:
+            raise ValueError("numero_quadros deve ser pelo menos 1")
+        quadros_memoria = self.quadros_memoria
+        mapa_quadros = self.mapa_quadros
+        while len(quadros_memoria) > numero_quadros:
+            self.numero_quadros = len(quadros_memoria)
+            quadro = mapa_quadros.pop(self.escolher_vitima(None))
+            ultima = quadros_memoria.pop()
+            if quadro < len(quadros_memoria):
+                quadros_memoria[quadro] = ultima
+                mapa_quadros[ultima] = quadro
+                self.ao_renumerar_quadro(len(quadros_memoria), quadro)
+        self.numero_quadros = min(self.numero_quadros, numero_quadros)
+        self.ao_reduzir_quadros()
+    
+    def _verificar_incremental(self):
+        if self.PRECISA_FUTURO:
+            raise ValueError(f"{self.NOME} precisa do trace completo; use executar()")
+    
+    def instantaneo(self) -> bytes:
+        estado = {chave: valor for chave, valor in self.__dict__.items()
+                  if chave not in ("rastreador", "mapa_quadros")}
+        return zlib.compress(pickle.dumps((type(self).__name__, estado), pickle.HIGHEST_PROTOCOL), 1)
+    
+    def restaurar(self, dados: bytes):
+        classe, estado = pickle.loads(zlib.decompress(dados))
+        if classe != type(self).__name__:
+            raise ValueError(f"Instantâneo de {classe} não pode ser restaurado em {type(self).__name__}")
+        rastreador = self.__dict__.get("rastreador")
+        self.__dict__.clear()
+        self.__dict__.update(estado)
+        self.rastreador = rastreador
+        self.mapa_quadros = {pagina: quadro for quadro, pagina in enumerate(self.quadros_memoria)}
+    
+    @classmethod
+    def de_instantaneo(cls, dados: bytes, rastreador: Optional[RastreadorPaginacao] = None) -> "AlgoritmoPaginacao":
+        algoritmo = cls.__new__(cls)
+        algoritmo.rastreador = rastreador
+        algoritmo.restaurar(dados)
+        return algoritmo
+    
+    def _alimentar(self, sequencia_paginas: Iterable[int]) -> int:
+        if self.metricas is not None:
+            return self._executar_instrumentado(sequencia_paginas)
+        rastreador = self.rastreador
+        historico = self.historico_estado if self.registrar_historico else None
+        registro = self.registro_acessos
+        mapa_quadros = self.mapa_quadros
+        quadros_memoria = self.quadros_memoria
+        numero_quadros = self.numero_quadros
+        ao_acertar = self.ao_acertar
+        escolher_vitima = self.escolher_vitima
+        ao_inserir = self.ao_inserir
+        
+        if rastreador is not None and self.passo == 0:
+            rastreador.inicio(self)
+        
+        idx = self.passo
+        for idx, pagina in enumerate(sequencia_paginas, idx + 1):
+            if pagina in mapa_quadros:
+                ao_acertar(pagina)
+                if rastreador is not None:
+                    rastreador.acerto(self, idx, pagina)
+                continue
+            
+            self.numero_paginas_faltantes += 1
+            if rastreador is not None:
+                rastreador.falta(self, idx, pagina)
+            
+            if len(quadros_memoria) < numero_quadros:
+                quadro = self._ocupar_quadro_livre(pagina)
+                pagina_removida = HistoricoCompacto.SEM_PAGINA
+            else:
+                pagina_removida = escolher_vitima(pagina)
+                quadro = self._substituir_pagina(pagina_removida, pagina)
+                if rastreador is not None:
+                    rastreador.remocao(self, idx, pagina_removida, quadro)
+            ao_inserir(pagina)
+            
+            if rastreador is not None:
+                rastreador.insercao(self, idx, pagina, quadro)
+            if historico is not None:
+                historico.registrar(idx, quadro, pagina_removida, pagina, quadros_memoria)
+            if registro is not None:
+                registro.marcar_falta(idx, pagina_removida)
+        
+        self.passo = idx
+        if registro is not None:
+            registro.finalizar(idx)
+        return self.numero_paginas_faltantes
+    
+    def executar_corridas(self, paginas: Sequence[int], repeticoes: Sequence[int]) -> int:
+        self.resetar()
+        paginas = self.preparar(paginas)
+        historico = self.historico_estado if self.registrar_historico else None
+        registro = self.registro_acessos
+        mapa_quadros = self.mapa_quadros
+        quadros_memoria = self.quadros_memoria
+        numero_quadros = self.numero_quadros
+        ao_acertar = self.ao_acertar
+        escolher_vitima = self.escolher_vitima
+        ao_inserir = self.ao_inserir
+        ao_acertos_repetidos = self.ao_acertos_repetidos
+        idx = 0
+        
+        for pagina, vezes in zip(paginas, repeticoes):
+            idx += 1
+            if pagina in mapa_quadros:
+                ao_acertar(pagina)
+            else:
+                self.numero_paginas_faltantes += 1
+                if len(quadros_memoria) < numero_quadros:
+                    quadro = self._ocupar_quadro_livre(pagina)
+                    pagina_removida = HistoricoCompacto.SEM_PAGINA
+                else:
+                    pagina_removida = escolher_vitima(pagina)
+                    quadro = self._substituir_pagina(pagina_removida, pagina)
+                ao_inserir(pagina)
+                if historico is not None:
+                    historico.registrar(idx, quadro, pagina_removida, pagina, quadros_memoria)
+                if registro is not None:
+                    registro.marcar_falta(idx, pagina_removida)
+            if vezes > 1:
+                ao_acertos_repetidos(pagina, vezes - 1)
+                idx += vezes - 1
+        
+        self.passo = idx
+        if registro is not None:
+            registro.finalizar(idx)
+        return self.numero_paginas_faltantes
+    
+    def _executar_instrumentado(self, sequencia_paginas: Iterable[int]) -> int:
+        metricas = self.metricas
+        relogio = time.perf_counter_ns
+        rastreador = self.rastreador
+        historico = self.historico_estado if self.registrar_historico else None
+        registro = self.registro_acessos
+        mapa_quadros = self.mapa_quadros
+        quadros_memoria = self.quadros_memoria
+        paginas_vistas = metricas._paginas_vistas
+        passo_insercao = metricas._passo_insercao
+        
+        if rastreador is not None and self.passo == 0:
+            rastreador.inicio(self)
+        
+        idx = self.passo
+        for idx, pagina in enumerate(sequencia_paginas, idx + 1):
+            inicio = relogio()
+            presente = pagina in mapa_quadros
+            fim = relogio()
+            metricas.tempo_busca_ns += fim - inicio
+            
+            if presente:
+                metricas.acertos += 1
+                self.ao_acertar(pagina)
+                metricas.tempo_atualizacao_ns += relogio() - fim
+                if rastreador is not None:
+                    rastreador.acerto(self, idx, pagina)
+                continue
+            
+            self.numero_paginas_faltantes += 1
+            metricas.faltas += 1
+            if pagina in paginas_vistas:
+                metricas.faltas_capacidade += 1
+            else:
+                metricas.faltas_compulsorias += 1
+                paginas_vistas.add(pagina)
+            if rastreador is not None:
+                rastreador.falta(self, idx, pagina)
+            
+            if len(quadros_memoria) < self.numero_quadros:
+                inicio = relogio()
+                quadro = self._ocupar_quadro_livre(pagina)
+                pagina_removida = HistoricoCompacto.SEM_PAGINA
+            else:
+                inicio = relogio()
+                pagina_removida = self.escolher_vitima(pagina)
+                fim = relogio()
+                metricas.tempo_escolha_vitima_ns += fim - inicio
+                inicio = fim
+                quadro = self._substituir_pagina(pagina_removida, pagina)
+                metricas.registrar_residencia(pagina_removida, idx)
+                if rastreador is not None:
+                    rastreador.remocao(self, idx, pagina_removida, quadro)
+            self.ao_inserir(pagina)
+            passo_insercao[pagina] = idx
+            metricas.tempo_atualizacao_ns += relogio() - inicio
+            self._ultima_removida = pagina_removida
+            
+            if rastreador is not None:
+                rastreador.insercao(self, idx, pagina, quadro)
+            if historico is not None:
+                historico.registrar(idx, quadro, pagina_removida, pagina, quadros_memoria)
+            if registro is not None:
+                registro.marcar_falta(idx, pagina_removida)
+        
+        self.passo = idx
+        if registro is not None:
+            registro.finalizar(idx)
+        return self.numero_paginas_faltantes
+    
+    def _novo_historico(self) -> HistoricoCompacto:
+        return HistoricoCompacto(max(64, self.numero_quadros))
+    
+    def estado_no_passo(self, passo: int) -> List[int]:
+        return self.historico_estado.estado_no_passo(passo)
+    
+    def quadro_da_pagina(self, pagina: int) -> Optional[int]:
+        return self.mapa_quadros.get(pagina)
+    
+    def _ocupar_quadro_livre(self, pagina: int) -> int:
+        quadro = len(self.quadros_memoria)
+        self.quadros_memoria.append(pagina)
+        self.mapa_quadros[pagina] = quadro
+        return quadro
+    
+    def _substituir_pagina(self, pagina_removida: int, pagina: int) -> int:
+        quadro = self.mapa_quadros.pop(pagina_removida)
+        self.quadros_memoria[quadro] = pagina
+        self.mapa_quadros[pagina] = quadro
+        return quadro
+    
+    def exibir_resultado(self, pagina_procurada: int, sequencia: Optional[Sequence[int]] = None):
+        print()
+        if sequencia is not None:
+            print(f"Sequência de páginas: {sequencia}")
         print(f"Número de quadros: {self.numero_quadros}")
         print(f"Total de page faults: {self.numero_paginas_faltantes}")
         
-        if pagina_procurada in self.quadros_memoria:
-            quadro = self.quadros_memoria.index(pagina_procurada)
+        quadro = self.quadro_da_pagina(pagina_procurada)
+        if quadro is not None:
             print(f"✓ Página {pagina_procurada} está no quadro: {quadro}")
         else:
             print(f"✗ Página {pagina_procurada} não está na memória no final da execução")
@@ -29,138 +599,2133 @@ class AlgoritmoPaginacao:
         print("\n" + "="*80)
         print("EXECUÇÃO PASSO A PASSO")
         print("="*80)
+        if not self.registrar_historico:
+            print("Histórico desativado (registrar_historico=False)")
         for passo, estado in enumerate(self.historico_estado, 1):
             print(f"Passo {passo}: {estado}")
         print("="*80)
 
+REGISTRO_POLITICAS: Dict[str, type] = {}
+
+def registrar_politica(classe: type) -> type:
+    if classe.NOME in REGISTRO_POLITICAS:
+        raise ValueError(f"Política já registrada: {classe.NOME}")
+    REGISTRO_POLITICAS[classe.NOME] = classe
+    return classe
+
+def listar_politicas() -> List[str]:
+    return list(REGISTRO_POLITICAS)
+
+def obter_politica(nome: str) -> type:
+    try:
+        return REGISTRO_POLITICAS[nome]
+    except KeyError:
+        raise ValueError(f"Política desconhecida: {nome} (disponíveis: {', '.join(REGISTRO_POLITICAS)})") from None
+
+@registrar_politica
 class FIFO(AlgoritmoPaginacao):
     
-    def executar(self, sequencia_paginas: List[int]) -> int:
+    NOME = "FIFO"
+    MOTIVO_REMOCAO = "mais antiga"
+    
+    def iniciar_politica(self):
+        self.fila_substituicao = deque()
+    
+    def escolher_vitima(self, pagina):
+        return self.fila_substituicao.popleft()
+    
+    def ao_inserir(self, pagina):
+        self.fila_substituicao.append(pagina)
+
+@registrar_politica
+class LRU(AlgoritmoPaginacao):
+    
+    NOME = "LRU"
+    MOTIVO_REMOCAO = "menos recentemente usada"
+    USA_RECENCIA = True
+    
+    def iniciar_politica(self):
+        self.ordem_recencia = OrderedDict()
+    
+    def ao_acertar(self, pagina):
+        self.ordem_recencia.move_to_end(pagina)
+    
+    def escolher_vitima(self, pagina):
+        return self.ordem_recencia.popitem(last=False)[0]
+    
+    def ao_inserir(self, pagina):
+        self.ordem_recencia[pagina] = None
+
+@registrar_politica
+class MRU(LRU):
+    
+    NOME = "MRU"
+    MOTIVO_REMOCAO = "mais recentemente usada"
+    
+    def escolher_vitima(self, pagina):
+        return self.ordem_recencia.popitem(last=True)[0]
+
+@registrar_politica
+class OPT(AlgoritmoPaginacao):
+    
+    NOME = "OPT"
+    MOTIVO_REMOCAO = "próximo uso mais distante"
+    PRECISA_FUTURO = True
+    
+    @staticmethod
+    def calcular_proximos_usos(paginas: Sequence[int]) -> array:
+        total = len(paginas)
+        proximos_usos = array("q", bytes(8 * total))
+        ultima_posicao = {}
+        for posicao in range(total - 1, -1, -1):
+            pagina = paginas[posicao]
+            proximos_usos[posicao] = ultima_posicao.get(pagina, total)
+            ultima_posicao[pagina] = posicao
+        return proximos_usos
+    
+    def iniciar_politica(self):
+        self.proximos_usos = array("q")
+        self.posicao = 0
+        self.proximo_uso_atual = {}
+        self.heap = []
+    
+    def preparar(self, sequencia_paginas):
+        if not isinstance(sequencia_paginas, (list, tuple, array)):
+            sequencia_paginas = array("q", sequencia_paginas)
+        self.proximos_usos = self.calcular_proximos_usos(sequencia_paginas)
+        return sequencia_paginas
+    
+    def ao_acertar(self, pagina):
+        proximo = self.proximos_usos[self.posicao]
+        self.posicao += 1
+        self.proximo_uso_atual[pagina] = proximo
+        heappush(self.heap, (-proximo, pagina))
+        if len(self.heap) > 2 * self.numero_quadros + 16:
+            self.heap = [(-uso, residente) for residente, uso in self.proximo_uso_atual.items()]
+            heapify(self.heap)
+    
+    def escolher_vitima(self, pagina):
+        while True:
+            uso_negativo, vitima = heappop(self.heap)
+            if self.proximo_uso_atual.get(vitima) == -uso_negativo:
+                del self.proximo_uso_atual[vitima]
+                return vitima
+    
+    def ao_inserir(self, pagina):
+        proximo = self.proximos_usos[self.posicao]
+        self.posicao += 1
+        self.proximo_uso_atual[pagina] = proximo
+        heappush(self.heap, (-proximo, pagina))
+    
+    def ao_acertos_repetidos(self, pagina, vezes):
+        pass
+
+@registrar_politica
+class CLOCK(AlgoritmoPaginacao):
+    
+    NOME = "CLOCK"
+    MOTIVO_REMOCAO = "bit de referência zerado sob o ponteiro"
+    
+    def iniciar_politica(self):
+        self.bits_referencia = bytearray(self.numero_quadros)
+        self.ponteiro = 0
+    
+    def ao_acertar(self, pagina):
+        self.bits_referencia[self.mapa_quadros[pagina]] = 1
+    
+    def escolher_vitima(self, pagina):
+        bits = self.bits_referencia
+        ponteiro = self.ponteiro
+        if ponteiro >= self.numero_quadros:
+            ponteiro = 0
+        while bits[ponteiro]:
+            bits[ponteiro] = 0
+            ponteiro += 1
+            if ponteiro == self.numero_quadros:
+                ponteiro = 0
+        vitima = self.quadros_memoria[ponteiro]
+        self.ponteiro = ponteiro + 1 if ponteiro + 1 < self.numero_quadros else 0
+        return vitima
+    
+    def ao_inserir(self, pagina):
+        self.bits_referencia[self.mapa_quadros[pagina]] = 0
+    
+    def ao_renumerar_quadro(self, origem, destino):
+        self.bits_referencia[destino] = self.bits_referencia[origem]
+    
+    def ao_reduzir_quadros(self):
+        del self.bits_referencia[self.numero_quadros:]
+        if self.ponteiro >= self.numero_quadros:
+            self.ponteiro = 0
+
+@registrar_politica
+class SegundaChance(AlgoritmoPaginacao):
+    
+    NOME = "SEGUNDA_CHANCE"
+    MOTIVO_REMOCAO = "mais antiga sem bit de referência"
+    
+    def iniciar_politica(self):
+        self.fila = deque()
+        self.referenciadas = set()
+    
+    def ao_acertar(self, pagina):
+        self.referenciadas.add(pagina)
+    
+    def escolher_vitima(self, pagina):
+        fila = self.fila
+        referenciadas = self.referenciadas
+        while True:
+            candidata = fila.popleft()
+            if candidata not in referenciadas:
+                return candidata
+            referenciadas.discard(candidata)
+            fila.append(candidata)
+    
+    def ao_inserir(self, pagina):
+        self.fila.append(pagina)
+
+@registrar_politica
+class LFU(AlgoritmoPaginacao):
+    
+    NOME = "LFU"
+    MOTIVO_REMOCAO = "menos frequentemente usada"
+    
+    def iniciar_politica(self):
+        self.frequencias = {}
+        self.baldes = defaultdict(OrderedDict)
+        self.heap_frequencias = []
+    
+    def ao_acertar(self, pagina):
+        self.ao_acertos_repetidos(pagina, 1)
+    
+    def ao_acertos_repetidos(self, pagina, vezes):
+        baldes = self.baldes
+        frequencia = self.frequencias[pagina]
+        balde = baldes[frequencia]
+        del balde[pagina]
+        if not balde:
+            del baldes[frequencia]
+        frequencia += vezes
+        self.frequencias[pagina] = frequencia
+        balde = baldes.get(frequencia)
+        if balde is None:
+            balde = baldes[frequencia] = OrderedDict()
+            self._novo_balde(frequencia)
+        balde[pagina] = None
+    
+    def _novo_balde(self, frequencia):
+        heap = self.heap_frequencias
+        heappush(heap, frequencia)
+        if len(heap) > 4 * len(self.baldes) + 64:
+            self.heap_frequencias = list(self.baldes)
+            heapify(self.heap_frequencias)
+    
+    def escolher_vitima(self, pagina):
+        heap = self.heap_frequencias
+        baldes = self.baldes
+        while True:
+            menor_frequencia = heap[0]
+            balde = baldes.get(menor_frequencia)
+            if balde:
+                break
+            heappop(heap)
+            if balde is not None:
+                del baldes[menor_frequencia]
+        vitima, _ = balde.popitem(last=False)
+        if not balde and menor_frequencia != 1:
+            del baldes[menor_frequencia]
+            heappop(heap)
+        del self.frequencias[vitima]
+        return vitima
+    
+    def ao_inserir(self, pagina):
+        self.frequencias[pagina] = 1
+        balde = self.baldes.get(1)
+        if balde is None:
+            balde = self.baldes[1] = OrderedDict()
+            self._novo_balde(1)
+        balde[pagina] = None
+
+@registrar_politica
+class DoisQ(AlgoritmoPaginacao):
+    
+    NOME = "2Q"
+    MOTIVO_REMOCAO = "fim de A1in ou menos recente de Am"
+    
+    def iniciar_politica(self):
+        self.limite_a1in = max(1, self.numero_quadros // 4)
+        self.limite_a1out = max(1, self.numero_quadros // 2)
+        self.a1in = OrderedDict()
+        self.a1out = OrderedDict()
+        self.am = OrderedDict()
+    
+    def ao_acertar(self, pagina):
+        if pagina in self.am:
+            self.am.move_to_end(pagina)
+    
+    def escolher_vitima(self, pagina):
+        if self.a1in and (len(self.a1in) > self.limite_a1in or not self.am):
+            vitima, _ = self.a1in.popitem(last=False)
+            self.a1out[vitima] = None
+            if len(self.a1out) > self.limite_a1out:
+                self.a1out.popitem(last=False)
+            return vitima
+        return self.am.popitem(last=False)[0]
+    
+    def ao_inserir(self, pagina):
+        if pagina in self.a1out:
+            del self.a1out[pagina]
+            self.am[pagina] = None
+        else:
+            self.a1in[pagina] = None
+    
+    def ao_reduzir_quadros(self):
+        self.limite_a1in = max(1, self.numero_quadros // 4)
+        self.limite_a1out = max(1, self.numero_quadros // 2)
+        while len(self.a1out) > self.limite_a1out:
+            self.a1out.popitem(last=False)
+
+@registrar_politica
+class ARC(AlgoritmoPaginacao):
+    
+    NOME = "ARC"
+    MOTIVO_REMOCAO = "menos recente de T1 ou T2, conforme o alvo adaptativo"
+    
+    def iniciar_politica(self):
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+        self.alvo_t1 = 0.0
+        self._reutilizada = False
+    
+    def ao_acertar(self, pagina):
+        if pagina in self.t1:
+            del self.t1[pagina]
+        else:
+            del self.t2[pagina]
+        self.t2[pagina] = None
+    
+    def _substituir(self, pagina_em_b2: bool) -> int:
+        if self.t1 and (len(self.t1) > self.alvo_t1 or (pagina_em_b2 and len(self.t1) == self.alvo_t1)):
+            vitima, _ = self.t1.popitem(last=False)
+            self.b1[vitima] = None
+        else:
+            vitima, _ = self.t2.popitem(last=False)
+            self.b2[vitima] = None
+        return vitima
+    
+    def escolher_vitima(self, pagina):
+        capacidade = self.numero_quadros
+        if pagina in self.b1:
+            self.alvo_t1 = min(capacidade, self.alvo_t1 + max(len(self.b2) / len(self.b1), 1))
+            vitima = self._substituir(False)
+            del self.b1[pagina]
+            self._reutilizada = True
+            return vitima
+        if pagina in self.b2:
+            self.alvo_t1 = max(0.0, self.alvo_t1 - max(len(self.b1) / len(self.b2), 1))
+            vitima = self._substituir(True)
+            del self.b2[pagina]
+            self._reutilizada = True
+            return vitima
+        
+        if len(self.t1) + len(self.b1) >= capacidade:
+            if len(self.t1) < capacidade:
+                self.b1.popitem(last=False)
+                return self._substituir(False)
+            return self.t1.popitem(last=False)[0]
+        if len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) >= 2 * capacidade:
+            self.b2.popitem(last=False)
+        return self._substituir(False)
+    
+    def ao_inserir(self, pagina):
+        if self._reutilizada:
+            self.t2[pagina] = None
+            self._reutilizada = False
+        else:
+            self.t1[pagina] = None
+    
+    def ao_reduzir_quadros(self):
+        capacidade = self.numero_quadros
+        self.alvo_t1 = min(self.alvo_t1, capacidade)
+        while self.b1 and len(self.t1) + len(self.b1) > capacidade:
+            self.b1.popitem(last=False)
+        while self.b2 and len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) > 2 * capacidade:
+            self.b2.popitem(last=False)
+
+class RemapeadorPaginas:
+    
+    def __init__(self):
+        self.ids = {}
+        self.originais = []
+    
+    @property
+    def universo(self) -> int:
+        return len(self.originais)
+    
+    def remapear(self, paginas: Iterable[int]) -> array:
+        ids = self.ids
+        originais = self.originais
+        resultado = array("I")
+        for pagina in paginas:
+            id_denso = ids.get(pagina)
+            if id_denso is None:
+                id_denso = ids[pagina] = len(originais)
+                originais.append(pagina)
+            resultado.append(id_denso)
+        return resultado
+    
+    def original(self, id_denso: int) -> int:
+        return self.originais[id_denso]
+
+class AlgoritmoDenso(AlgoritmoPaginacao):
+    
+    def __init__(self, numero_quadros: int, remapeador: Optional[RemapeadorPaginas] = None,
+                 registrar_historico: bool = True):
+        super().__init__(numero_quadros, registrar_historico=registrar_historico)
+        self.remapeador = remapeador if remapeador is not None else RemapeadorPaginas()
+    
+    def executar(self, sequencia_paginas: Iterable[int]) -> int:
+        return self.executar_ids(self.remapeador.remapear(sequencia_paginas))
+    
+    def _verificar_incremental(self):
+        raise ValueError(f"{type(self).__name__} só executa traces completos; use {self.NOME} para acessos incrementais")
+    
+    def executar_ids(self, ids: Sequence[int]) -> int:
         self.resetar()
-        fila_substituicao = deque()
+        universo = self.remapeador.universo
+        self.quadro_por_id = array("i", [-1]) * universo
+        self._simular(ids, self.historico_estado if self.registrar_historico else None)
+        self.passo = len(ids)
+        self.mapa_quadros.update((pagina, quadro) for quadro, pagina in enumerate(self.quadros_memoria))
+        return self.numero_paginas_faltantes
+    
+    def _simular(self, ids: Sequence[int], historico: Optional[HistoricoCompacto]):
+        raise NotImplementedError
+
+class FIFODenso(AlgoritmoDenso):
+    
+    NOME = "FIFO"
+    
+    def _simular(self, ids, historico):
+        quadro_por_id = self.quadro_por_id
+        id_por_quadro = array("i", [-1]) * self.numero_quadros
+        quadros_memoria = self.quadros_memoria
+        originais = self.remapeador.originais
+        numero_quadros = self.numero_quadros
+        ponteiro = 0
+        faltas = 0
         
-        print("\n--- Iniciando execução FIFO ---")
+        for idx, id_denso in enumerate(ids, 1):
+            if quadro_por_id[id_denso] >= 0:
+                continue
+            faltas += 1
+            if len(quadros_memoria) < numero_quadros:
+                quadro = len(quadros_memoria)
+                quadros_memoria.append(originais[id_denso])
+                pagina_removida = HistoricoCompacto.SEM_PAGINA
+            else:
+                quadro = ponteiro
+                ponteiro = ponteiro + 1 if ponteiro + 1 < numero_quadros else 0
+                vitima = id_por_quadro[quadro]
+                quadro_por_id[vitima] = -1
+                pagina_removida = originais[vitima]
+                quadros_memoria[quadro] = originais[id_denso]
+            id_por_quadro[quadro] = id_denso
+            quadro_por_id[id_denso] = quadro
+            if historico is not None:
+                historico.registrar(idx, quadro, pagina_removida, originais[id_denso], quadros_memoria)
         
-        for idx, pagina in enumerate(sequencia_paginas, 1):
-            print(f"\nPasso {idx}: Acessando página {pagina}")
-            
-            if pagina in self.quadros_memoria:
-                print(f"  ✓ Página {pagina} já está na memória (HIT)")
-                print(f"  Estado da memória: {self.quadros_memoria}")
+        self.numero_paginas_faltantes = faltas
+
+class LRUDenso(AlgoritmoDenso):
+    
+    NOME = "LRU"
+    
+    def _simular(self, ids, historico):
+        quadro_por_id = self.quadro_por_id
+        quadros_memoria = self.quadros_memoria
+        originais = self.remapeador.originais
+        numero_quadros = self.numero_quadros
+        recencia = OrderedDict()
+        mover_para_o_fim = recencia.move_to_end
+        faltas = 0
+        
+        for idx, id_denso in enumerate(ids, 1):
+            if quadro_por_id[id_denso] >= 0:
+                mover_para_o_fim(id_denso)
                 continue
             
-            self.numero_paginas_faltantes += 1
-            print(f"  ✗ Page Fault! Página {pagina} não está na memória")
+            faltas += 1
+            if len(quadros_memoria) < numero_quadros:
+                quadro = len(quadros_memoria)
+                quadros_memoria.append(originais[id_denso])
+                pagina_removida = HistoricoCompacto.SEM_PAGINA
+            else:
+                vitima, _ = recencia.popitem(last=False)
+                quadro = quadro_por_id[vitima]
+                quadro_por_id[vitima] = -1
+                pagina_removida = originais[vitima]
+                quadros_memoria[quadro] = originais[id_denso]
+            quadro_por_id[id_denso] = quadro
+            recencia[id_denso] = None
             
-            if len(self.quadros_memoria) < self.numero_quadros:
-                self.quadros_memoria.append(pagina)
-                fila_substituicao.append(pagina)
-                print(f"  → Adicionando página {pagina} no quadro {len(self.quadros_memoria)-1}")
+            if historico is not None:
+                historico.registrar(idx, quadro, pagina_removida, originais[id_denso], quadros_memoria)
+        
+        self.numero_paginas_faltantes = faltas
+
+class MRUDenso(AlgoritmoDenso):
+    
+    NOME = "MRU"
+    
+    def _simular(self, ids, historico):
+        quadro_por_id = self.quadro_por_id
+        quadros_memoria = self.quadros_memoria
+        originais = self.remapeador.originais
+        numero_quadros = self.numero_quadros
+        anterior = -1
+        faltas = 0
+        
+        for idx, id_denso in enumerate(ids, 1):
+            if quadro_por_id[id_denso] >= 0:
+                anterior = id_denso
+                continue
+            faltas += 1
+            if len(quadros_memoria) < numero_quadros:
+                quadro = len(quadros_memoria)
+                quadros_memoria.append(originais[id_denso])
+                pagina_removida = HistoricoCompacto.SEM_PAGINA
             else:
-                pagina_removida = fila_substituicao.popleft()
-                quadro_removido = self.quadros_memoria.index(pagina_removida)
-                self.quadros_memoria.remove(pagina_removida)
-                self.quadros_memoria.append(pagina)
-                fila_substituicao.append(pagina)
-                print(f"  → Removendo página {pagina_removida} do quadro {quadro_removido} (mais antiga)")
-                print(f"  → Adicionando página {pagina} no quadro {quadro_removido}")
+                quadro = quadro_por_id[anterior]
+                quadro_por_id[anterior] = -1
+                pagina_removida = originais[anterior]
+                quadros_memoria[quadro] = originais[id_denso]
+            quadro_por_id[id_denso] = quadro
+            anterior = id_denso
             
-            print(f"  Estado da memória: {self.quadros_memoria}")
-            self.historico_estado.append(self.quadros_memoria.copy())
+            if historico is not None:
+                historico.registrar(idx, quadro, pagina_removida, originais[id_denso], quadros_memoria)
         
-        return self.numero_paginas_faltantes
+        self.numero_paginas_faltantes = faltas
 
-class LRU(AlgoritmoPaginacao):
+SIMULADORES_DENSOS = {"FIFO": FIFODenso, "LRU": LRUDenso, "MRU": MRUDenso}
+
+POLITICAS_LOTE = ("FIFO", "LRU", "MRU")
+
+def simular_lote(nome_politica: str, traces, numero_quadros, comprimentos=None):
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("simular_lote requer NumPy (pip install numpy)") from None
+    
+    if nome_politica not in POLITICAS_LOTE:
+        raise ValueError(f"Política sem simulação em lote: {nome_politica} (disponíveis: {', '.join(POLITICAS_LOTE)})")
+    
+    traces = np.asarray(traces, dtype=np.int64)
+    quadros_por_linha = np.asarray(numero_quadros, dtype=np.int64)
+    if traces.ndim == 1:
+        linhas = max(quadros_por_linha.size, 1)
+        traces = np.broadcast_to(traces, (linhas, traces.size))
+    elif traces.ndim != 2:
+        raise ValueError("traces deve ser 1-D ou 2-D")
+    linhas, passos = traces.shape
+    quadros_por_linha = np.broadcast_to(quadros_por_linha, (linhas,))
+    if linhas == 0:
+        return np.zeros(0, dtype=np.int64)
+    if quadros_por_linha.min() < 1:
+        raise ValueError("numero_quadros deve ser pelo menos 1")
+    if comprimentos is None:
+        comprimentos = np.full(linhas, passos, dtype=np.int64)
+    else:
+        comprimentos = np.broadcast_to(np.asarray(comprimentos, dtype=np.int64), (linhas,))
+    
+    maximo_quadros = int(quadros_por_linha.max())
+    traces_por_passo = np.ascontiguousarray(traces.T)
+    quadros = np.full((linhas, maximo_quadros), -1, dtype=np.int64)
+    validos = np.arange(maximo_quadros) < quadros_por_linha[:, None]
+    
+    grande = np.iinfo(np.int64).max
+    remove_maior = nome_politica == "MRU"
+    if remove_maior:
+        carimbos = np.where(validos, grande, -1)
+    else:
+        carimbos = np.where(validos, -1, grande)
+    atualiza_no_acerto = nome_politica != "FIFO"
+    
+    faltas = np.zeros(linhas, dtype=np.int64)
+    todas_ativas = bool((comprimentos >= passos).all())
+    
+    for passo in range(passos):
+        paginas = traces_por_passo[passo]
+        iguais = quadros == paginas[:, None]
+        acerto = iguais.any(axis=1)
+        if atualiza_no_acerto:
+            carimbos[iguais] = passo
+        falta = ~acerto
+        if not todas_ativas:
+            falta &= passo < comprimentos
+        linhas_falta = np.flatnonzero(falta)
+        if linhas_falta.size == 0:
+            continue
+        if remove_maior:
+            vitimas = carimbos[linhas_falta].argmax(axis=1)
+        else:
+            vitimas = carimbos[linhas_falta].argmin(axis=1)
+        quadros[linhas_falta, vitimas] = paginas[linhas_falta]
+        carimbos[linhas_falta, vitimas] = passo
+        faltas[linhas_falta] += 1
+    
+    return faltas
+
+class SimuladorMultiprocesso:
+    
+    POLITICAS = ("FIFO", "LRU", "MRU")
     
-    def executar(self, sequencia_paginas: List[int]) -> int:
+    def __init__(self, nome_politica: str, numero_quadros: int, numero_processos: int,
+                 local: bool = False, quadros_por_processo=None):
+        if nome_politica not in self.POLITICAS:
+            raise ValueError(f"Política sem simulação multiprocesso: {nome_politica} "
+                             f"(disponíveis: {', '.join(self.POLITICAS)})")
+        if numero_quadros < 1 or numero_processos < 1:
+            raise ValueError("numero_quadros e numero_processos devem ser pelo menos 1")
+        self.NOME = nome_politica
+        self.numero_quadros = numero_quadros
+        self.numero_processos = numero_processos
+        self.local = local
+        self.cotas = None
+        if local:
+            if quadros_por_processo is None:
+                base, sobra = divmod(numero_quadros, numero_processos)
+                cotas = array("q", [base + 1]) * sobra + array("q", [base]) * (numero_processos - sobra)
+            elif isinstance(quadros_por_processo, int):
+                cotas = array("q", [quadros_por_processo]) * numero_processos
+            else:
+                cotas = array("q", quadros_por_processo)
+            if len(cotas) != numero_processos:
+                raise ValueError("quadros_por_processo deve ter uma cota por processo")
+            if min(cotas) < 1 or sum(cotas) > numero_quadros:
+                raise ValueError("as cotas devem ser pelo menos 1 e somar no máximo numero_quadros")
+            self.cotas = cotas
         self.resetar()
-        tempo_ultimo_uso = {}
-        tempo_atual = 0
-        
-        print("\n--- Iniciando execução LRU ---")
+    
+    def resetar(self):
+        numero_quadros = self.numero_quadros
+        numero_processos = self.numero_processos
+        listas = numero_processos if self.local else 1
+        self.cabeca = array("i", [-1]) * listas
+        self.cauda = array("i", [-1]) * listas
+        self.anterior = array("i", [-1]) * numero_quadros
+        self.proximo = array("i", [-1]) * numero_quadros
+        self.chave_quadro = [None] * numero_quadros
+        self.quadro_da_chave = {}
+        self.quadros_usados = 0
+        self.acessos_por_processo = array("q", [0]) * numero_processos
+        self.faltas_por_processo = array("q", [0]) * numero_processos
+        self.residentes_por_processo = array("q", [0]) * numero_processos
+        self.remocoes_por_processo = array("q", [0]) * numero_processos
+        self.numero_paginas_faltantes = 0
+    
+    def executar(self, acessos: Iterable[Tuple[int, int]]) -> int:
+        self.resetar()
+        numero_processos = self.numero_processos
+        numero_quadros = self.numero_quadros
+        local = self.local
+        cotas = self.cotas
+        move_no_acerto = self.NOME != "FIFO"
+        remove_mais_recente = self.NOME == "MRU"
+        cabeca = self.cabeca
+        cauda = self.cauda
+        anterior = self.anterior
+        proximo = self.proximo
+        chave_quadro = self.chave_quadro
+        quadro_da_chave = self.quadro_da_chave
+        acessos_por_processo = self.acessos_por_processo
+        faltas_por_processo = self.faltas_por_processo
+        residentes = self.residentes_por_processo
+        remocoes = self.remocoes_por_processo
+        quadros_usados = 0
+        faltas = 0
+        lista = 0
         
-        for idx, pagina in enumerate(sequencia_paginas, 1):
-            tempo_atual += 1
-            print(f"\nPasso {idx}: Acessando página {pagina}")
+        for pid, pagina in acessos:
+            if not 0 <= pid < numero_processos:
+                raise ValueError(f"pid {pid} fora do intervalo 0..{numero_processos - 1}")
+            acessos_por_processo[pid] += 1
+            chave = pagina * numero_processos + pid
+            quadro = quadro_da_chave.get(chave)
+            if local:
+                lista = pid
             
-            if pagina in self.quadros_memoria:
-                tempo_ultimo_uso[pagina] = tempo_atual
-                print(f"  ✓ Página {pagina} já está na memória (HIT)")
-                print(f"  → Atualizando timestamp da página {pagina} para {tempo_atual}")
-                print(f"  Estado da memória: {self.quadros_memoria}")
+            if quadro is not None:
+                if move_no_acerto and cauda[lista] != quadro:
+                    antes = anterior[quadro]
+                    depois = proximo[quadro]
+                    if antes >= 0:
+                        proximo[antes] = depois
+                    else:
+                        cabeca[lista] = depois
+                    anterior[depois] = antes
+                    ultimo = cauda[lista]
+                    anterior[quadro] = ultimo
+                    proximo[quadro] = -1
+                    proximo[ultimo] = quadro
+                    cauda[lista] = quadro
                 continue
             
-            self.numero_paginas_faltantes += 1
-            print(f"  ✗ Page Fault! Página {pagina} não está na memória")
-            
-            if len(self.quadros_memoria) < self.numero_quadros:
-                self.quadros_memoria.append(pagina)
-                tempo_ultimo_uso[pagina] = tempo_atual
-                print(f"  → Adicionando página {pagina} no quadro {len(self.quadros_memoria)-1}")
+            faltas += 1
+            faltas_por_processo[pid] += 1
+            if (residentes[pid] < cotas[pid]) if local else (quadros_usados < numero_quadros):
+                quadro = quadros_usados
+                quadros_usados += 1
             else:
-                pagina_menos_usada = min(self.quadros_memoria, 
-                                        key=lambda p: tempo_ultimo_uso.get(p, 0))
-                quadro_removido = self.quadros_memoria.index(pagina_menos_usada)
-                print(f"  → Removendo página {pagina_menos_usada} do quadro {quadro_removido} (menos recentemente usada, timestamp: {tempo_ultimo_uso.get(pagina_menos_usada, 0)})")
-                
-                self.quadros_memoria.remove(pagina_menos_usada)
-                del tempo_ultimo_uso[pagina_menos_usada]
-                
-                self.quadros_memoria.append(pagina)
-                tempo_ultimo_uso[pagina] = tempo_atual
-                print(f"  → Adicionando página {pagina} no quadro {quadro_removido}")
+                if remove_mais_recente:
+                    quadro = cauda[lista]
+                    antes = anterior[quadro]
+                    cauda[lista] = antes
+                    if antes >= 0:
+                        proximo[antes] = -1
+                    else:
+                        cabeca[lista] = -1
+                else:
+                    quadro = cabeca[lista]
+                    depois = proximo[quadro]
+                    cabeca[lista] = depois
+                    if depois >= 0:
+                        anterior[depois] = -1
+                    else:
+                        cauda[lista] = -1
+                chave_vitima = chave_quadro[quadro]
+                del quadro_da_chave[chave_vitima]
+                pid_vitima = chave_vitima % numero_processos
+                residentes[pid_vitima] -= 1
+                remocoes[pid_vitima] += 1
             
-            print(f"  Estado da memória: {self.quadros_memoria}")
-            print(f"  Timestamps: {tempo_ultimo_uso}")
-            self.historico_estado.append(self.quadros_memoria.copy())
+            chave_quadro[quadro] = chave
+            quadro_da_chave[chave] = quadro
+            residentes[pid] += 1
+            ultimo = cauda[lista]
+            anterior[quadro] = ultimo
+            proximo[quadro] = -1
+            if ultimo >= 0:
+                proximo[ultimo] = quadro
+            else:
+                cabeca[lista] = quadro
+            cauda[lista] = quadro
         
-        return self.numero_paginas_faltantes
+        self.quadros_usados = quadros_usados
+        self.numero_paginas_faltantes = faltas
+        return faltas
+    
+    def executar_colunas(self, pids: Iterable[int], paginas: Iterable[int]) -> int:
+        return self.executar(zip(pids, paginas))
+    
+    def paginas_do_processo(self, pid: int) -> List[int]:
+        numero_processos = self.numero_processos
+        return [chave // numero_processos for chave in self.chave_quadro
+                if chave is not None and chave % numero_processos == pid]
+    
+    def exibir_resultado(self, limite: int = 10):
+        print()
+        print(f"Política: {self.NOME} ({'local' if self.local else 'global'})")
+        print(f"Quadros: {self.numero_quadros}, processos: {self.numero_processos}")
+        print(f"Total de page faults: {self.numero_paginas_faltantes}")
+        faltas = self.faltas_por_processo
+        maiores = sorted(range(self.numero_processos), key=faltas.__getitem__, reverse=True)[:limite]
+        print(f"{'PID':>8} {'Acessos':>10} {'Faltas':>10} {'Residentes':>11} {'Remoções':>10}")
+        for pid in maiores:
+            print(f"{pid:>8} {self.acessos_por_processo[pid]:>10} {faltas[pid]:>10} "
+                  f"{self.residentes_por_processo[pid]:>11} {self.remocoes_por_processo[pid]:>10}")
+
+class DistanciasPilha:
+    
+    PRIMEIRA_REFERENCIA = 0
+    
+    def __init__(self, capacidade_inicial: int = 1 << 16):
+        self.capacidade_inicial = capacidade_inicial
+        self.ultimo_acesso = {}
+        self._arvore = [0] * (capacidade_inicial + 1)
+        self._proxima_posicao = 1
+    
+    def _compactar(self):
+        paginas = sorted(self.ultimo_acesso, key=self.ultimo_acesso.__getitem__)
+        capacidade = max(self.capacidade_inicial, 2 * len(paginas))
+        arvore = [0] * (capacidade + 1)
+        for posicao, pagina in enumerate(paginas, 1):
+            self.ultimo_acesso[pagina] = posicao
+            arvore[posicao] = 1
+        for posicao in range(1, capacidade + 1):
+            pai = posicao + (posicao & -posicao)
+            if pai <= capacidade:
+                arvore[pai] += arvore[posicao]
+        self._arvore = arvore
+        self._proxima_posicao = len(paginas) + 1
+    
+    def acessar(self, pagina: int) -> int:
+        arvore = self._arvore
+        if self._proxima_posicao >= len(arvore):
+            self._compactar()
+            arvore = self._arvore
+        tamanho = len(arvore) - 1
+        
+        anterior = self.ultimo_acesso.get(pagina)
+        if anterior is None:
+            distancia = self.PRIMEIRA_REFERENCIA
+        else:
+            soma = 0
+            i = anterior
+            while i > 0:
+                soma += arvore[i]
+                i -= i & -i
+            distancia = len(self.ultimo_acesso) - soma + 1
+            i = anterior
+            while i <= tamanho:
+                arvore[i] -= 1
+                i += i & -i
+        
+        posicao = self._proxima_posicao
+        self._proxima_posicao = posicao + 1
+        self.ultimo_acesso[pagina] = posicao
+        i = posicao
+        while i <= tamanho:
+            arvore[i] += 1
+            i += i & -i
+        return distancia
+    
+    def remover(self, pagina: int):
+        posicao = self.ultimo_acesso.pop(pagina, None)
+        if posicao is None:
+            return
+        arvore = self._arvore
+        tamanho = len(arvore) - 1
+        while posicao <= tamanho:
+            arvore[posicao] -= 1
+            posicao += posicao & -posicao
+
+class CurvaFalhasLRU:
+    
+    def __init__(self, histograma: List[int], faltas_compulsorias: int, total_acessos: int):
+        self.histograma = histograma
+        self.faltas_compulsorias = faltas_compulsorias
+        self.total_acessos = total_acessos
+        
+        faltas = [0] * max(len(histograma), 1)
+        acumulado = faltas_compulsorias
+        for quadros in range(len(faltas) - 1, -1, -1):
+            faltas[quadros] = acumulado
+            acumulado += histograma[quadros] if quadros < len(histograma) else 0
+        self.faltas_por_quadros = faltas
+    
+    def falhas(self, numero_quadros: int) -> int:
+        if numero_quadros < 0:
+            raise ValueError("numero_quadros não pode ser negativo")
+        if numero_quadros >= len(self.faltas_por_quadros):
+            return self.faltas_compulsorias
+        return self.faltas_por_quadros[numero_quadros]
+    
+    def taxa_falhas(self, numero_quadros: int) -> float:
+        if self.total_acessos == 0:
+            return 0.0
+        return self.falhas(numero_quadros) / self.total_acessos
+    
+    def curva(self, max_quadros: Optional[int] = None) -> List[int]:
+        if max_quadros is None:
+            max_quadros = len(self.faltas_por_quadros) - 1
+        return [self.falhas(quadros) for quadros in range(max_quadros + 1)]
+    
+    def curva_taxa_falhas(self, max_quadros: Optional[int] = None) -> List[float]:
+        total = self.total_acessos or 1
+        return [falhas / total for falhas in self.curva(max_quadros)]
+
+def curva_falhas_lru(sequencia_paginas: Iterable[int]) -> CurvaFalhasLRU:
+    distancias = DistanciasPilha()
+    acessar = distancias.acessar
+    histograma = [0]
+    faltas_compulsorias = 0
+    total_acessos = 0
+    
+    for pagina in sequencia_paginas:
+        total_acessos += 1
+        distancia = acessar(pagina)
+        if distancia == DistanciasPilha.PRIMEIRA_REFERENCIA:
+            faltas_compulsorias += 1
+            continue
+        if distancia >= len(histograma):
+            histograma.extend([0] * (distancia + 1 - len(histograma)))
+        histograma[distancia] += 1
+    
+    return CurvaFalhasLRU(histograma, faltas_compulsorias, total_acessos)
+
+ESCALA_AMOSTRAGEM = 1 << 24
+
+def hash_amostragem(pagina: int) -> int:
+    return ((pagina * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 40
+
+class EstimativaAmostrada:
+    
+    def falhas(self, numero_quadros: int) -> float:
+        raise NotImplementedError
+    
+    def taxa_falhas(self, numero_quadros: int) -> float:
+        if self.total_acessos == 0:
+            return 0.0
+        return self.falhas(numero_quadros) / self.total_acessos
+    
+    def erro_padrao(self, numero_quadros: int) -> float:
+        taxa = self.taxa_falhas(numero_quadros)
+        return (taxa * (1.0 - taxa) / max(self.paginas_amostradas, 1)) ** 0.5
+    
+    def intervalo_taxa_falhas(self, numero_quadros: int, z: float = 1.96) -> Tuple[float, float]:
+        taxa = self.taxa_falhas(numero_quadros)
+        margem = z * self.erro_padrao(numero_quadros)
+        return max(taxa - margem, 0.0), min(taxa + margem, 1.0)
+    
+    def curva(self, quadros: Iterable[int]) -> List[float]:
+        return [self.falhas(numero_quadros) for numero_quadros in quadros]
+    
+    def curva_taxa_falhas(self, quadros: Iterable[int]) -> List[float]:
+        return [self.taxa_falhas(numero_quadros) for numero_quadros in quadros]
 
-class MRU(AlgoritmoPaginacao):
+class CurvaFalhasAmostrada(EstimativaAmostrada):
+    
+    def __init__(self, histograma: Dict[int, float], faltas_compulsorias: float,
+                 total_acessos: int, taxa: float, paginas_amostradas: int):
+        self.histograma = histograma
+        self.faltas_compulsorias = faltas_compulsorias
+        self.total_acessos = total_acessos
+        self.taxa = taxa
+        self.paginas_amostradas = paginas_amostradas
+        
+        self._distancias = sorted(histograma)
+        self._acima = [0.0] * (len(self._distancias) + 1)
+        for i in range(len(self._distancias) - 1, -1, -1):
+            self._acima[i] = self._acima[i + 1] + histograma[self._distancias[i]]
+    
+    def falhas(self, numero_quadros: int) -> float:
+        if numero_quadros < 0:
+            raise ValueError("numero_quadros não pode ser negativo")
+        estimativa = self.faltas_compulsorias + self._acima[bisect_right(self._distancias, numero_quadros)]
+        return min(max(estimativa, 0.0), float(self.total_acessos))
+
+def curva_falhas_lru_amostrada(sequencia_paginas: Iterable[int], taxa: float = 0.01,
+                               max_paginas: int = 8192) -> CurvaFalhasAmostrada:
+    if not 0 < taxa <= 1:
+        raise ValueError("taxa deve estar em (0, 1]")
+    if max_paginas < 1:
+        raise ValueError("max_paginas deve ser pelo menos 1")
+    
+    limiar = max(1, int(taxa * ESCALA_AMOSTRAGEM))
+    distancias = DistanciasPilha()
+    acessar = distancias.acessar
+    hash_pagina = hash_amostragem
+    paginas_amostradas = distancias.ultimo_acesso
+    por_hash = []
+    histograma = defaultdict(float)
+    faltas_compulsorias = 0.0
+    total_acessos = 0
+    
+    for pagina in sequencia_paginas:
+        total_acessos += 1
+        valor_hash = hash_pagina(pagina)
+        if valor_hash >= limiar:
+            continue
+        distancia = acessar(pagina)
+        if distancia != DistanciasPilha.PRIMEIRA_REFERENCIA:
+            histograma[distancia * ESCALA_AMOSTRAGEM // limiar] += 1.0
+            continue
+        
+        faltas_compulsorias += 1.0
+        heappush(por_hash, (-valor_hash, pagina))
+        if len(paginas_amostradas) > max_paginas:
+            novo_limiar = -por_hash[0][0]
+            while por_hash and -por_hash[0][0] >= novo_limiar:
+                distancias.remover(heappop(por_hash)[1])
+            fator = novo_limiar / limiar
+            for chave in histograma:
+                histograma[chave] *= fator
+            faltas_compulsorias *= fator
+            limiar = novo_limiar
+    
+    taxa_final = limiar / ESCALA_AMOSTRAGEM
+    diferenca = total_acessos * taxa_final - (faltas_compulsorias + sum(histograma.values()))
+    if total_acessos and diferenca:
+        histograma[1] += diferenca
+    escala = 1.0 / taxa_final
+    return CurvaFalhasAmostrada(
+        {distancia: contagem * escala for distancia, contagem in histograma.items()},
+        faltas_compulsorias * escala,
+        total_acessos,
+        taxa_final,
+        len(paginas_amostradas),
+    )
+
+class FalhasAmostradas(EstimativaAmostrada):
+    
+    def __init__(self, estimativas: Dict[int, float], total_acessos: int, taxa: float,
+                 paginas_amostradas: int):
+        self.estimativas = estimativas
+        self.total_acessos = total_acessos
+        self.taxa = taxa
+        self.paginas_amostradas = paginas_amostradas
+    
+    def falhas(self, numero_quadros: int) -> float:
+        if numero_quadros not in self.estimativas:
+            raise ValueError(f"Sem estimativa para {numero_quadros} quadros")
+        return min(max(self.estimativas[numero_quadros], 0.0), float(self.total_acessos))
+
+def estimar_falhas_amostradas(nome_politica: str, sequencia_paginas: Iterable[int],
+                              quadros: Iterable[int], taxa: float = 0.01,
+                              max_paginas: int = 8192) -> FalhasAmostradas:
+    if not 0 < taxa <= 1:
+        raise ValueError("taxa deve estar em (0, 1]")
+    if max_paginas < 1:
+        raise ValueError("max_paginas deve ser pelo menos 1")
+    classe = obter_politica(nome_politica)
+    if classe.PRECISA_FUTURO:
+        raise ValueError(f"{classe.NOME} precisa do trace completo e não tem estimativa amostrada")
+    quadros = list(quadros)
+    limiar = max(1, int(taxa * ESCALA_AMOSTRAGEM))
+    simulacoes = [classe(max(1, round(numero_quadros * limiar / ESCALA_AMOSTRAGEM)), registrar_historico=False)
+                  for numero_quadros in quadros]
+    faltas = [0.0] * len(quadros)
+    contadas = [0] * len(quadros)
+    hash_pagina = hash_amostragem
+    hashes = {}
+    por_hash = []
+    bloco = []
+    total_acessos = 0
+    
+    def descarregar():
+        for i, simulacao in enumerate(simulacoes):
+            total = simulacao.alimentar(bloco)
+            faltas[i] += total - contadas[i]
+            contadas[i] = total
+        bloco.clear()
+    
+    for pagina in sequencia_paginas:
+        total_acessos += 1
+        valor_hash = hash_pagina(pagina)
+        if valor_hash >= limiar:
+            continue
+        if pagina not in hashes:
+            hashes[pagina] = valor_hash
+            heappush(por_hash, (-valor_hash, pagina))
+            if len(hashes) > max_paginas:
+                descarregar()
+                novo_limiar = -por_hash[0][0]
+                while por_hash and -por_hash[0][0] >= novo_limiar:
+                    del hashes[heappop(por_hash)[1]]
+                fator = novo_limiar / limiar
+                limiar = novo_limiar
+                for i, numero_quadros in enumerate(quadros):
+                    faltas[i] *= fator
+                    simulacoes[i].reduzir_quadros(max(1, round(numero_quadros * limiar / ESCALA_AMOSTRAGEM)))
+                if pagina not in hashes:
+                    continue
+        bloco.append(pagina)
+        if len(bloco) >= 1024:
+            descarregar()
+    
+    descarregar()
+    taxa_final = limiar / ESCALA_AMOSTRAGEM
+    estimativas = {numero_quadros: faltas[i] / taxa_final for i, numero_quadros in enumerate(quadros)}
+    return FalhasAmostradas(estimativas, total_acessos, taxa_final, len(hashes))
+
+class CurvaConjuntoTrabalho:
+    
+    def __init__(self, intervalos: List[int], cobertura: List[int], primeiras_referencias: int,
+                 total_acessos: int):
+        self.intervalos = intervalos
+        self.primeiras_referencias = primeiras_referencias
+        self.total_acessos = total_acessos
+        
+        maior = max(len(intervalos), len(cobertura))
+        soma_tamanhos = [0] * maior
+        faltas = [0] * maior
+        restantes_cobertura = sum(cobertura)
+        restantes_intervalos = sum(intervalos)
+        for tau in range(1, maior):
+            soma_tamanhos[tau] = soma_tamanhos[tau - 1] + restantes_cobertura
+            restantes_cobertura -= cobertura[tau] if tau < len(cobertura) else 0
+            restantes_intervalos -= intervalos[tau] if tau < len(intervalos) else 0
+            faltas[tau] = primeiras_referencias + restantes_intervalos
+        if maior:
+            faltas[0] = total_acessos
+        self.soma_tamanhos = soma_tamanhos
+        self.faltas = faltas
+    
+    def tamanho_medio(self, tau: int) -> float:
+        if tau < 0:
+            raise ValueError("tau não pode ser negativo")
+        if self.total_acessos == 0:
+            return 0.0
+        if tau >= len(self.soma_tamanhos):
+            return self.soma_tamanhos[-1] / self.total_acessos
+        return self.soma_tamanhos[tau] / self.total_acessos
+    
+    def taxa_falhas(self, tau: int) -> float:
+        if tau < 0:
+            raise ValueError("tau não pode ser negativo")
+        if self.total_acessos == 0:
+            return 0.0
+        if tau >= len(self.faltas):
+            return self.primeiras_referencias / self.total_acessos
+        return self.faltas[tau] / self.total_acessos
+    
+    def curva(self, max_tau: Optional[int] = None) -> List[Tuple[float, float]]:
+        if max_tau is None:
+            max_tau = max(len(self.soma_tamanhos) - 1, 0)
+        return [(self.tamanho_medio(tau), self.taxa_falhas(tau)) for tau in range(max_tau + 1)]
+
+def curva_conjunto_trabalho(sequencia_paginas: Iterable[int]) -> CurvaConjuntoTrabalho:
+    ultimo_acesso = {}
+    intervalos = [0]
+    cobertura = [0]
+    total_acessos = 0
+    
+    for posicao, pagina in enumerate(sequencia_paginas, 1):
+        total_acessos = posicao
+        anterior = ultimo_acesso.get(pagina)
+        ultimo_acesso[pagina] = posicao
+        if anterior is None:
+            continue
+        intervalo = posicao - anterior
+        if intervalo >= len(intervalos):
+            intervalos.extend([0] * (intervalo + 1 - len(intervalos)))
+            cobertura.extend([0] * (intervalo + 1 - len(cobertura)))
+        intervalos[intervalo] += 1
+        cobertura[intervalo] += 1
+    
+    for posicao in ultimo_acesso.values():
+        restante = total_acessos - posicao + 1
+        if restante >= len(cobertura):
+            cobertura.extend([0] * (restante + 1 - len(cobertura)))
+        cobertura[restante] += 1
+    
+    return CurvaConjuntoTrabalho(intervalos, cobertura, len(ultimo_acesso), total_acessos)
+
+def tamanhos_conjunto_trabalho(sequencia_paginas: Iterable[int], tau: int) -> array:
+    if tau < 1:
+        raise ValueError("tau deve ser pelo menos 1")
+    janela = deque()
+    ultimo_acesso = {}
+    tamanhos = array("q")
+    tamanho = 0
+    
+    for posicao, pagina in enumerate(sequencia_paginas, 1):
+        anterior = ultimo_acesso.get(pagina)
+        if anterior is None or posicao - anterior > tau:
+            tamanho += 1
+        ultimo_acesso[pagina] = posicao
+        janela.append(pagina)
+        if len(janela) > tau:
+            saindo = janela.popleft()
+            if ultimo_acesso[saindo] == posicao - tau:
+                tamanho -= 1
+        tamanhos.append(tamanho)
+    return tamanhos
+
+class SimuladorPFF:
+    
+    NOME = "PFF"
     
-    def executar(self, sequencia_paginas: List[int]) -> int:
+    def __init__(self, limiar: int):
+        if limiar < 1:
+            raise ValueError("limiar deve ser pelo menos 1")
+        self.limiar = limiar
         self.resetar()
-        tempo_ultimo_uso = {}
-        tempo_atual = 0
+    
+    def resetar(self):
+        self.residentes = set()
+        self.numero_paginas_faltantes = 0
+        self.total_acessos = 0
+        self.tamanho_maximo = 0
+        self.soma_tamanhos = 0
+    
+    @property
+    def tamanho_medio(self) -> float:
+        return self.soma_tamanhos / self.total_acessos if self.total_acessos else 0.0
+    
+    def executar(self, sequencia_paginas: Iterable[int]) -> int:
+        self.resetar()
+        limiar = self.limiar
+        residentes = set()
+        usadas = set()
+        ultima_falta = 0
+        faltas = 0
+        soma_tamanhos = 0
+        tamanho_maximo = 0
+        posicao = 0
         
-        print("\n--- Iniciando execução MRU ---")
+        for posicao, pagina in enumerate(sequencia_paginas, 1):
+            if pagina in residentes:
+                usadas.add(pagina)
+            else:
+                faltas += 1
+                if posicao - ultima_falta > limiar:
+                    residentes = usadas
+                residentes.add(pagina)
+                usadas = {pagina}
+                ultima_falta = posicao
+                if len(residentes) > tamanho_maximo:
+                    tamanho_maximo = len(residentes)
+            soma_tamanhos += len(residentes)
         
-        for idx, pagina in enumerate(sequencia_paginas, 1):
-            tempo_atual += 1
-            print(f"\nPasso {idx}: Acessando página {pagina}")
-            
-            if pagina in self.quadros_memoria:
-                tempo_ultimo_uso[pagina] = tempo_atual
-                print(f"  ✓ Página {pagina} já está na memória (HIT)")
-                print(f"  → Atualizando timestamp da página {pagina} para {tempo_atual}")
-                print(f"  Estado da memória: {self.quadros_memoria}")
+        self.residentes = residentes
+        self.numero_paginas_faltantes = faltas
+        self.total_acessos = posicao
+        self.soma_tamanhos = soma_tamanhos
+        self.tamanho_maximo = tamanho_maximo
+        return faltas
+    
+    def exibir_resultado(self):
+        print()
+        print(f"Limiar entre faltas: {self.limiar}")
+        print(f"Total de page faults: {self.numero_paginas_faltantes}")
+        print(f"Quadros ocupados: média {self.tamanho_medio:.2f}, máximo {self.tamanho_maximo}")
+
+def impressao_digital_trace(paginas: Iterable[int]) -> str:
+    import hashlib
+    
+    resumo = hashlib.blake2b(digest_size=16)
+    if isinstance(paginas, array) and paginas.typecode == "q":
+        resumo.update(memoryview(paginas))
+    else:
+        iterador = iter(paginas)
+        while True:
+            bloco = array("q", islice(iterador, 1 << 16))
+            if not bloco:
+                break
+            resumo.update(memoryview(bloco))
+    return resumo.hexdigest()
+
+class CacheResultados:
+    
+    EXTENSAO = ".json"
+    INTERVALO_MEDICAO = 256
+    
+    def __init__(self, diretorio: Optional[str] = None, tamanho_maximo: int = 64 << 20):
+        if diretorio is None:
+            diretorio = os.environ.get("PAGINACAO_CACHE") or os.path.join(
+                os.path.expanduser("~"), ".cache", "paginacao")
+        self.diretorio = diretorio
+        self.tamanho_maximo = tamanho_maximo
+        os.makedirs(diretorio, exist_ok=True)
+        self._tamanho_estimado = self._medir()[0]
+        self._gravacoes = 0
+    
+    @staticmethod
+    def chave(impressao_trace: str, nome_politica: str, numero_quadros: int, **parametros) -> str:
+        import hashlib
+        import json
+        
+        versao = obter_politica(nome_politica).VERSAO
+        texto = json.dumps([impressao_trace, nome_politica, versao, numero_quadros, parametros], sort_keys=True)
+        return hashlib.sha256(texto.encode()).hexdigest()
+    
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, chave + self.EXTENSAO)
+    
+    def obter(self, chave: str) -> Optional[dict]:
+        import json
+        
+        caminho = self._caminho(chave)
+        try:
+            with open(caminho, encoding="utf-8") as arquivo:
+                valor = json.load(arquivo)
+        except (FileNotFoundError, ValueError):
+            return None
+        try:
+            os.utime(caminho)
+        except OSError:
+            pass
+        return valor
+    
+    def guardar(self, chave: str, valor: dict):
+        import json
+        import tempfile
+        
+        descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(descritor, "w", encoding="utf-8") as arquivo:
+                json.dump(valor, arquivo)
+                tamanho = arquivo.tell()
+            os.replace(temporario, self._caminho(chave))
+        except BaseException:
+            try:
+                os.unlink(temporario)
+            except OSError:
+                pass
+            raise
+        
+        self._tamanho_estimado += tamanho
+        self._gravacoes += 1
+        if self._tamanho_estimado > self.tamanho_maximo or self._gravacoes % self.INTERVALO_MEDICAO == 0:
+            self._remover_antigos()
+    
+    def _medir(self) -> Tuple[int, List[Tuple[float, int, str]]]:
+        entradas = []
+        total = 0
+        with os.scandir(self.diretorio) as iterador:
+            for entrada in iterador:
+                if not entrada.name.endswith(self.EXTENSAO):
+                    continue
+                try:
+                    estado = entrada.stat()
+                except FileNotFoundError:
+                    continue
+                entradas.append((estado.st_mtime, estado.st_size, entrada.path))
+                total += estado.st_size
+        return total, entradas
+    
+    def _remover_antigos(self):
+        with self._lock():
+            total, entradas = self._medir()
+            if total > self.tamanho_maximo:
+                entradas.sort()
+                alvo = self.tamanho_maximo * 9 // 10
+                for _, tamanho, caminho in entradas:
+                    if total <= alvo:
+                        break
+                    try:
+                        os.unlink(caminho)
+                    except FileNotFoundError:
+                        pass
+                    total -= tamanho
+            self._tamanho_estimado = total
+    
+    @contextmanager
+    def _lock(self):
+        try:
+            import fcntl
+        except ImportError:
+            yield
+            return
+        with open(os.path.join(self.diretorio, ".lock"), "a") as arquivo:
+            fcntl.flock(arquivo, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(arquivo, fcntl.LOCK_UN)
+    
+    def limpar(self):
+        with self._lock():
+            for _, _, caminho in self._medir()[1]:
+                try:
+                    os.unlink(caminho)
+                except FileNotFoundError:
+                    pass
+            self._tamanho_estimado = 0
+
+_traces_do_processo = {}
+_ids_do_processo = {}
+
+def _inicializar_processo(traces: Dict[str, array]):
+    global _traces_do_processo, _ids_do_processo
+    _traces_do_processo = traces
+    _ids_do_processo = {}
+
+def _ids_trace_processo(nome_trace: str) -> Tuple[RemapeadorPaginas, array]:
+    remapeado = _ids_do_processo.get(nome_trace)
+    if remapeado is None:
+        remapeador = RemapeadorPaginas()
+        remapeado = _ids_do_processo[nome_trace] = (remapeador, remapeador.remapear(_traces_do_processo[nome_trace]))
+    return remapeado
+
+def _executar_celula(celula: Tuple[str, str, int], rastreador: Optional[RastreadorPaginacao] = None,
+                     sequencia: Optional[Iterable[int]] = None) -> dict:
+    nome_trace, nome_algoritmo, numero_quadros = celula
+    if sequencia is None and rastreador is None and nome_algoritmo in SIMULADORES_DENSOS:
+        remapeador, ids = _ids_trace_processo(nome_trace)
+        algoritmo = SIMULADORES_DENSOS[nome_algoritmo](numero_quadros, remapeador, registrar_historico=False)
+        inicio = time.perf_counter()
+        falhas = algoritmo.executar_ids(ids)
+        segundos = time.perf_counter() - inicio
+    else:
+        if sequencia is None:
+            sequencia = _traces_do_processo[nome_trace]
+        algoritmo = obter_politica(nome_algoritmo)(numero_quadros, rastreador, registrar_historico=False)
+        inicio = time.perf_counter()
+        falhas = algoritmo.executar(sequencia)
+        segundos = time.perf_counter() - inicio
+    
+    return {
+        "trace": nome_trace,
+        "algoritmo": nome_algoritmo,
+        "quadros": numero_quadros,
+        "acessos": algoritmo.passo,
+        "falhas": falhas,
+        "taxa_falhas": falhas / algoritmo.passo if algoritmo.passo else 0.0,
+        "segundos": segundos,
+    }
+
+def executar_varredura(traces: Dict[str, Iterable[int]],
+                       algoritmos: Sequence[str] = ("FIFO", "LRU", "MRU"),
+                       quadros: Sequence[int] = (8,),
+                       processos: Optional[int] = None,
+                       cache: Optional[CacheResultados] = None) -> List[dict]:
+    for nome_algoritmo in algoritmos:
+        obter_politica(nome_algoritmo)
+    
+    traces_compactos = {nome: array("q", paginas) for nome, paginas in traces.items()}
+    celulas = [(nome_trace, nome_algoritmo, numero_quadros)
+               for nome_trace in traces_compactos
+               for nome_algoritmo in algoritmos
+               for numero_quadros in quadros]
+    
+    resultados = [None] * len(celulas)
+    chaves = []
+    if cache is not None:
+        impressoes = {nome: impressao_digital_trace(paginas) for nome, paginas in traces_compactos.items()}
+        for i, (nome_trace, nome_algoritmo, numero_quadros) in enumerate(celulas):
+            chave = cache.chave(impressoes[nome_trace], nome_algoritmo, numero_quadros)
+            chaves.append(chave)
+            linha = cache.obter(chave)
+            if linha is not None:
+                linha["trace"] = nome_trace
+                linha["em_cache"] = True
+                resultados[i] = linha
+    pendentes = [i for i, linha in enumerate(resultados) if linha is None]
+    
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = max(1, min(processos, len(pendentes)))
+    
+    if processos == 1:
+        _inicializar_processo(traces_compactos)
+        calculadas = [_executar_celula(celulas[i]) for i in pendentes]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        tamanho_lote = max(1, len(pendentes) // (processos * 4))
+        with ProcessPoolExecutor(max_workers=processos,
+                                 initializer=_inicializar_processo,
+                                 initargs=(traces_compactos,)) as executor:
+            calculadas = list(executor.map(_executar_celula, [celulas[i] for i in pendentes],
+                                           chunksize=tamanho_lote))
+    
+    for i, linha in zip(pendentes, calculadas):
+        if cache is not None:
+            cache.guardar(chaves[i], linha)
+        linha["em_cache"] = False
+        resultados[i] = linha
+    return resultados
+
+def exibir_tabela_varredura(resultados: List[dict]):
+    print(f"{'Trace':<20} {'Algoritmo':<10} {'Quadros':>8} {'Acessos':>10} {'Faltas':>10} {'Taxa':>8} {'Tempo (s)':>10}")
+    print("-"*80)
+    for linha in resultados:
+        print(f"{linha['trace']:<20} {linha['algoritmo']:<10} {linha['quadros']:>8} "
+              f"{linha['acessos']:>10} {linha['falhas']:>10} {linha['taxa_falhas']:>8.2%} "
+              f"{linha['segundos']:>10.4f}")
+
+def _resumir_bloco_lru(argumentos: Tuple[array, int]) -> Tuple[int, int, List[int], List[int]]:
+    paginas, numero_quadros = argumentos
+    lru = LRU(numero_quadros, registrar_historico=False)
+    faltas = lru.executar(paginas)
+    distintas = dict.fromkeys(paginas)
+    primeiras = list(islice(distintas, numero_quadros))
+    return faltas, len(distintas), primeiras, list(reversed(lru.ordem_recencia))
+
+def _costurar_lru(resumos: Iterable[Tuple[int, int, List[int], List[int]]], numero_quadros: int) -> int:
+    pilha = []
+    total = 0
+    for faltas, _, primeiras, pilha_bloco in resumos:
+        posicao_na_pilha = {pagina: r for r, pagina in enumerate(pilha, 1)}
+        arvore = [0] * (numero_quadros + 1)
+        acertos = 0
+        for k, pagina in enumerate(primeiras, 1):
+            r = posicao_na_pilha.get(pagina)
+            if r is None:
                 continue
-            
-            self.numero_paginas_faltantes += 1
-            print(f"  ✗ Page Fault! Página {pagina} não está na memória")
-            
-            if len(self.quadros_memoria) < self.numero_quadros:
-                self.quadros_memoria.append(pagina)
-                tempo_ultimo_uso[pagina] = tempo_atual
-                print(f"  → Adicionando página {pagina} no quadro {len(self.quadros_memoria)-1}")
-            else:
-                pagina_mais_usada = max(self.quadros_memoria, 
-                                       key=lambda p: tempo_ultimo_uso.get(p, 0))
-                quadro_removido = self.quadros_memoria.index(pagina_mais_usada)
-                print(f"  → Removendo página {pagina_mais_usada} do quadro {quadro_removido} (mais recentemente usada, timestamp: {tempo_ultimo_uso.get(pagina_mais_usada, 0)})")
+            anteriores = 0
+            i = r - 1
+            while i > 0:
+                anteriores += arvore[i]
+                i -= i & -i
+            if k - 1 + r - anteriores <= numero_quadros:
+                acertos += 1
+            i = r
+            while i <= numero_quadros:
+                arvore[i] += 1
+                i += i & -i
+        total += faltas - acertos
+        
+        if len(pilha_bloco) < numero_quadros:
+            no_bloco = set(pilha_bloco)
+            pilha_bloco = pilha_bloco + [pagina for pagina in pilha
+                                         if pagina not in no_bloco][:numero_quadros - len(pilha_bloco)]
+        pilha = pilha_bloco
+    return total
+
+def _avancar_fifo(fila: deque, residentes: set, paginas: Iterable[int], numero_quadros: int) -> int:
+    faltas = 0
+    for pagina in paginas:
+        if pagina not in residentes:
+            faltas += 1
+            if len(fila) == numero_quadros:
+                residentes.discard(fila.popleft())
+            fila.append(pagina)
+            residentes.add(pagina)
+    return faltas
+
+def _especular_bloco_fifo(argumentos: Tuple[array, int, int]) -> Tuple[int, list, tuple]:
+    paginas, numero_quadros, intervalo = argumentos
+    fila = deque()
+    residentes = set()
+    faltas = 0
+    pontos = [(0, 0, ())]
+    for inicio in range(0, len(paginas), intervalo):
+        trecho = paginas[inicio:inicio + intervalo]
+        faltas += _avancar_fifo(fila, residentes, trecho, numero_quadros)
+        pontos.append((inicio + len(trecho), faltas, tuple(fila)))
+    return faltas, pontos, tuple(fila)
+
+def _costurar_fifo(blocos: Sequence[array], resumos: Iterable[Tuple[int, list, tuple]],
+                   numero_quadros: int) -> int:
+    fila = deque()
+    residentes = set()
+    total = 0
+    for paginas, (faltas_especuladas, pontos, fila_final) in zip(blocos, resumos):
+        faltas = 0
+        posicao_atual = 0
+        for posicao, faltas_ate, estado in pontos:
+            faltas += _avancar_fifo(fila, residentes, paginas[posicao_atual:posicao], numero_quadros)
+            posicao_atual = posicao
+            if len(fila) == len(estado) and tuple(fila) == estado:
+                faltas += faltas_especuladas - faltas_ate
+                fila = deque(fila_final)
+                residentes = set(fila_final)
+                break
+        else:
+            faltas += _avancar_fifo(fila, residentes, paginas[posicao_atual:], numero_quadros)
+        total += faltas
+    return total
+
+POLITICAS_EM_BLOCOS = ("FIFO", "LRU")
+
+def simular_em_blocos(nome_politica: str, paginas: Sequence[int], numero_quadros: int,
+                      processos: Optional[int] = None, tamanho_bloco: Optional[int] = None) -> int:
+    if nome_politica not in POLITICAS_EM_BLOCOS:
+        raise ValueError(f"Política sem simulação em blocos: {nome_politica} "
+                         f"(disponíveis: {', '.join(POLITICAS_EM_BLOCOS)})")
+    if numero_quadros < 1:
+        raise ValueError("numero_quadros deve ser pelo menos 1")
+    if isinstance(paginas, TraceCompacto):
+        paginas = paginas.paginas
+    
+    if processos is None:
+        processos = os.cpu_count() or 1
+    total_acessos = len(paginas)
+    if tamanho_bloco is None:
+        tamanho_bloco = -(-total_acessos // max(processos, 1))
+    tamanho_bloco = max(tamanho_bloco, 4 * numero_quadros, 1)
+    blocos = [array("q", paginas[inicio:inicio + tamanho_bloco])
+              for inicio in range(0, total_acessos, tamanho_bloco)]
+    
+    if nome_politica == "LRU":
+        trabalho = _resumir_bloco_lru
+        argumentos = [(bloco, numero_quadros) for bloco in blocos]
+    else:
+        trabalho = _especular_bloco_fifo
+        intervalo = max(4 * numero_quadros, 4096)
+        argumentos = [(bloco, numero_quadros, intervalo) for bloco in blocos]
+    
+    processos = max(1, min(processos, len(blocos)))
+    if processos == 1:
+        resumos = [trabalho(argumento) for argumento in argumentos]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resumos = list(executor.map(trabalho, argumentos))
+    
+    if nome_politica == "LRU":
+        return _costurar_lru(resumos, numero_quadros)
+    return _costurar_fifo(blocos, resumos, numero_quadros)
+
+def gerar_zipf(tamanho: int, universo: int, alfa: float = 1.0, semente: int = 0) -> array:
+    import random
+    aleatorio = random.Random(semente)
+    acumulado = []
+    total = 0.0
+    for k in range(universo):
+        total += 1.0 / (k + 1) ** alfa
+        acumulado.append(total)
+    return array("q", aleatorio.choices(range(universo), cum_weights=acumulado, k=tamanho))
+
+def gerar_varredura(tamanho: int, inicio: int = 0) -> array:
+    return array("q", range(inicio, inicio + tamanho))
+
+def gerar_laco(tamanho: int, comprimento_laco: int) -> array:
+    return array("q", (posicao % comprimento_laco for posicao in range(tamanho)))
+
+def gerar_fases(tamanho: int, conjunto_trabalho: int, numero_fases: int = 4, semente: int = 0) -> array:
+    import random
+    aleatorio = random.Random(semente)
+    paginas = array("q")
+    por_fase = max(1, tamanho // numero_fases)
+    for fase in range(numero_fases):
+        quantidade = por_fase if fase < numero_fases - 1 else tamanho - len(paginas)
+        base = fase * (conjunto_trabalho // 2)
+        paginas.extend(base + aleatorio.randrange(conjunto_trabalho) for _ in range(quantidade))
+    return paginas
+
+def gerar_mista(tamanho: int, universo: int, semente: int = 0) -> array:
+    import random
+    aleatorio = random.Random(semente)
+    quentes = gerar_zipf(tamanho, universo, 1.0, semente)
+    paginas = array("q")
+    while len(paginas) < tamanho:
+        trecho = min(aleatorio.randint(100, 1000), tamanho - len(paginas))
+        padrao = aleatorio.randrange(4)
+        if padrao == 0:
+            paginas.extend(quentes[len(paginas):len(paginas) + trecho])
+        elif padrao == 1:
+            paginas.extend(gerar_varredura(trecho, aleatorio.randrange(universo)))
+        elif padrao == 2:
+            base = aleatorio.randrange(universo)
+            paginas.extend(base + pagina for pagina in gerar_laco(trecho, aleatorio.randint(10, 200)))
+        else:
+            paginas.extend(aleatorio.randrange(universo) for _ in range(trecho))
+    return paginas
+
+CARGAS_SINTETICAS = {
+    "zipf": lambda tamanho, semente: gerar_zipf(tamanho, 10_000, 1.0, semente),
+    "varredura": lambda tamanho, semente: gerar_varredura(tamanho),
+    "laco": lambda tamanho, semente: gerar_laco(tamanho, 5_000),
+    "fases": lambda tamanho, semente: gerar_fases(tamanho, 2_000, 8, semente),
+    "mista": lambda tamanho, semente: gerar_mista(tamanho, 10_000, semente),
+}
+
+def executar_benchmark(tamanhos: Sequence[int] = (10_000, 100_000),
+                       quadros: Sequence[int] = (64, 1024),
+                       politicas: Optional[Sequence[str]] = None,
+                       cargas: Optional[Sequence[str]] = None,
+                       repeticoes: int = 3,
+                       semente: int = 42) -> List[dict]:
+    import tracemalloc
+    
+    politicas = list(politicas or listar_politicas())
+    cargas = list(cargas or CARGAS_SINTETICAS)
+    resultados = []
+    
+    for nome_carga in cargas:
+        for tamanho in tamanhos:
+            trace = CARGAS_SINTETICAS[nome_carga](tamanho, semente)
+            remapeador = RemapeadorPaginas()
+            ids = remapeador.remapear(trace)
+            for nome_politica in politicas:
+                classe = obter_politica(nome_politica)
+                classe_densa = SIMULADORES_DENSOS.get(nome_politica)
                 
-                self.quadros_memoria.remove(pagina_mais_usada)
-                del tempo_ultimo_uso[pagina_mais_usada]
+                def preparar(numero_quadros: int):
+                    if classe_densa is not None:
+                        return classe_densa(numero_quadros, remapeador, registrar_historico=False).executar_ids, ids
+                    return classe(numero_quadros, registrar_historico=False).executar, trace
                 
-                self.quadros_memoria.append(pagina)
-                tempo_ultimo_uso[pagina] = tempo_atual
-                print(f"  → Adicionando página {pagina} no quadro {quadro_removido}")
-            
-            print(f"  Estado da memória: {self.quadros_memoria}")
-            print(f"  Timestamps: {tempo_ultimo_uso}")
-            self.historico_estado.append(self.quadros_memoria.copy())
+                for numero_quadros in quadros:
+                    melhor_tempo = float("inf")
+                    for _ in range(repeticoes):
+                        executar, entrada = preparar(numero_quadros)
+                        inicio = time.perf_counter()
+                        falhas = executar(entrada)
+                        melhor_tempo = min(melhor_tempo, time.perf_counter() - inicio)
+                    
+                    executar, entrada = preparar(numero_quadros)
+                    tracemalloc.start()
+                    executar(entrada)
+                    _, pico = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    
+                    resultados.append({
+                        "carga": nome_carga,
+                        "politica": nome_politica,
+                        "acessos": tamanho,
+                        "quadros": numero_quadros,
+                        "falhas": falhas,
+                        "segundos": melhor_tempo,
+                        "acessos_por_segundo": tamanho / melhor_tempo if melhor_tempo > 0 else float("inf"),
+                        "pico_memoria_kb": pico / 1024,
+                    })
+    return resultados
+
+def salvar_baseline(resultados: List[dict], caminho: str):
+    import json
+    import platform
+    
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump({
+            "versao_formato": 1,
+            "python": platform.python_version(),
+            "maquina": platform.machine(),
+            "resultados": resultados,
+        }, arquivo, indent=2)
+
+def comparar_com_baseline(resultados: List[dict], caminho: str, tolerancia: float = 0.2) -> List[dict]:
+    import json
+    
+    with open(caminho, encoding="utf-8") as arquivo:
+        baseline = json.load(arquivo)
+    chave = lambda linha: (linha["carga"], linha["politica"], linha["acessos"], linha["quadros"])
+    referencia = {chave(linha): linha for linha in baseline["resultados"]}
+    
+    regressoes = []
+    for linha in resultados:
+        anterior = referencia.get(chave(linha))
+        if anterior is None:
+            continue
+        if linha["falhas"] != anterior["falhas"]:
+            motivo = f"page faults mudaram: {anterior['falhas']} -> {linha['falhas']}"
+        elif linha["acessos_por_segundo"] < anterior["acessos_por_segundo"] * (1 - tolerancia):
+            queda = 1 - linha["acessos_por_segundo"] / anterior["acessos_por_segundo"]
+            motivo = f"vazão caiu {queda:.0%}"
+        else:
+            continue
+        regressoes.append(dict(linha, acessos_por_segundo_baseline=anterior["acessos_por_segundo"], motivo=motivo))
+    return regressoes
+
+def exibir_benchmark(resultados: List[dict]):
+    print(f"{'Carga':<10} {'Política':<15} {'Acessos':>9} {'Quadros':>8} {'Faltas':>9} {'Acessos/s':>12} {'Pico (KB)':>10}")
+    print("-"*80)
+    for linha in resultados:
+        print(f"{linha['carga']:<10} {linha['politica']:<15} {linha['acessos']:>9} {linha['quadros']:>8} "
+              f"{linha['falhas']:>9} {linha['acessos_por_segundo']:>12,.0f} {linha['pico_memoria_kb']:>10.1f}")
+
+_TIPOS_POR_LARGURA = {array(tipo).itemsize: tipo for tipo in "QLIHB"}
+
+def ler_trace_texto(caminho: str, bytes_por_bloco: int = 1 << 20) -> Iterator[int]:
+    with open(caminho, "rb") as arquivo:
+        resto = b""
+        while True:
+            bloco = arquivo.read(bytes_por_bloco)
+            if not bloco:
+                break
+            bloco = resto + bloco.replace(b",", b" ")
+            tokens = bloco.split()
+            if tokens and not bloco[-1:].isspace():
+                resto = tokens.pop()
+            else:
+                resto = b""
+            yield from map(int, tokens)
+        if resto:
+            yield int(resto)
+
+def ler_trace_binario(caminho: str, largura: int = 4, paginas_por_bloco: int = 1 << 18) -> Iterator[int]:
+    if largura not in _TIPOS_POR_LARGURA:
+        raise ValueError(f"Largura inválida: {largura} (use 1, 2, 4 ou 8)")
+    tipo = _TIPOS_POR_LARGURA[largura]
+    
+    with open(caminho, "rb") as arquivo:
+        while True:
+            dados = arquivo.read(paginas_por_bloco * largura)
+            if not dados:
+                break
+            if len(dados) % largura:
+                raise ValueError(f"Trace truncado: {caminho} não tem tamanho múltiplo de {largura} bytes")
+            paginas = array(tipo)
+            paginas.frombytes(dados)
+            if sys.byteorder == "big":
+                paginas.byteswap()
+            yield from paginas
+
+_CABECALHO_TRACE = struct.Struct("<4sBBHQQ")
+ASSINATURA_TRACE = b"PGTR"
+VERSAO_TRACE = 1
+FLAG_CORRIDAS = 1
+_TIPO_REPETICOES = _TIPOS_POR_LARGURA[4]
+_MAX_REPETICOES = (1 << 32) - 1
+
+def _alinhar(deslocamento: int) -> int:
+    return (deslocamento + 7) & ~7
+
+def gravar_trace_compacto(caminho: str, paginas: Iterable[int], largura: int = 4,
+                          dobrar_repeticoes: bool = True, paginas_por_bloco: int = 1 << 18):
+    if largura not in _TIPOS_POR_LARGURA:
+        raise ValueError(f"Largura inválida: {largura} (use 1, 2, 4 ou 8)")
+    tipo = _TIPOS_POR_LARGURA[largura]
+    
+    import tempfile
+    
+    entradas = 0
+    total_acessos = 0
+    buffer_paginas = array(tipo)
+    buffer_repeticoes = array(_TIPO_REPETICOES)
+    
+    def descarregar(destino, buffer):
+        if sys.byteorder == "big":
+            buffer.byteswap()
+        buffer.tofile(destino)
+        del buffer[:]
+    
+    with open(caminho, "wb") as arquivo, tempfile.TemporaryFile() as temporario:
+        arquivo.write(bytes(_CABECALHO_TRACE.size))
+        pagina_atual = None
+        repeticoes = 0
         
-        return self.numero_paginas_faltantes
+        for pagina in chain(paginas, [None]):
+            if dobrar_repeticoes and pagina == pagina_atual and pagina is not None and repeticoes < _MAX_REPETICOES:
+                repeticoes += 1
+                continue
+            if pagina_atual is not None:
+                try:
+                    buffer_paginas.append(pagina_atual)
+                except OverflowError:
+                    raise ValueError(f"Página {pagina_atual} não cabe em {largura} bytes sem sinal") from None
+                buffer_repeticoes.append(repeticoes)
+                entradas += 1
+                total_acessos += repeticoes
+                if len(buffer_paginas) >= paginas_por_bloco:
+                    descarregar(arquivo, buffer_paginas)
+                    if dobrar_repeticoes:
+                        descarregar(temporario, buffer_repeticoes)
+                    else:
+                        del buffer_repeticoes[:]
+            pagina_atual = pagina
+            repeticoes = 1
+        
+        descarregar(arquivo, buffer_paginas)
+        if dobrar_repeticoes:
+            descarregar(temporario, buffer_repeticoes)
+            arquivo.write(bytes(_alinhar(arquivo.tell()) - arquivo.tell()))
+            temporario.seek(0)
+            while True:
+                dados = temporario.read(1 << 20)
+                if not dados:
+                    break
+                arquivo.write(dados)
+        
+        arquivo.seek(0)
+        arquivo.write(_CABECALHO_TRACE.pack(ASSINATURA_TRACE, VERSAO_TRACE, largura,
+                                            FLAG_CORRIDAS if dobrar_repeticoes else 0,
+                                            entradas, total_acessos))
+
+def converter_trace_texto(origem: str, destino: str, largura: Optional[int] = None,
+                          dobrar_repeticoes: bool = True):
+    if largura is None:
+        maior = max(ler_trace_texto(origem), default=0)
+        largura = next(bytes_ for bytes_ in sorted(_TIPOS_POR_LARGURA) if maior < 1 << (8 * bytes_))
+    gravar_trace_compacto(destino, ler_trace_texto(origem), largura, dobrar_repeticoes)
+
+class TraceCompacto:
+    
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._arquivo = open(caminho, "rb")
+        tamanho_arquivo = os.fstat(self._arquivo.fileno()).st_size
+        if tamanho_arquivo < _CABECALHO_TRACE.size:
+            self._arquivo.close()
+            raise ValueError(f"{caminho} não é um trace compacto (arquivo curto demais)")
+        cabecalho = self._arquivo.read(_CABECALHO_TRACE.size)
+        assinatura, versao, largura, flags, entradas, total_acessos = _CABECALHO_TRACE.unpack(cabecalho)
+        if assinatura != ASSINATURA_TRACE or versao != VERSAO_TRACE or largura not in _TIPOS_POR_LARGURA:
+            self._arquivo.close()
+            raise ValueError(f"{caminho} não é um trace compacto versão {VERSAO_TRACE}")
+        
+        self.largura = largura
+        self.total_acessos = total_acessos
+        self.entradas = entradas
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        bruto = memoryview(self._mapa)
+        
+        inicio = _CABECALHO_TRACE.size
+        fim = inicio + entradas * largura
+        self.paginas = self._coluna(bruto[inicio:fim], _TIPOS_POR_LARGURA[largura])
+        self.repeticoes = None
+        if flags & FLAG_CORRIDAS:
+            inicio = _alinhar(fim)
+            self.repeticoes = self._coluna(bruto[inicio:inicio + entradas * 4], _TIPO_REPETICOES)
+    
+    @staticmethod
+    def _coluna(bruto: memoryview, tipo: str):
+        if sys.byteorder == "little":
+            return bruto.cast(tipo)
+        valores = array(tipo, bruto.tobytes())
+        valores.byteswap()
+        return valores
+    
+    def __len__(self) -> int:
+        return self.total_acessos
+    
+    def __iter__(self) -> Iterator[int]:
+        if self.repeticoes is None:
+            return iter(self.paginas)
+        return chain.from_iterable(map(repeat, self.paginas, self.repeticoes))
+    
+    def fechar(self):
+        for coluna in (self.paginas, self.repeticoes):
+            if isinstance(coluna, memoryview):
+                coluna.release()
+        self.paginas = self.repeticoes = None
+        self._mapa.close()
+        self._arquivo.close()
+    
+    def __enter__(self) -> "TraceCompacto":
+        return self
+    
+    def __exit__(self, *excecao):
+        self.fechar()
+
+_traces_servidor = OrderedDict()
+MAX_TRACES_ABERTOS = 32
+
+def _trace_servidor(caminho: str) -> "TraceCompacto":
+    trace = _traces_servidor.get(caminho)
+    if trace is None:
+        trace = _traces_servidor[caminho] = TraceCompacto(caminho)
+        if len(_traces_servidor) > MAX_TRACES_ABERTOS:
+            _traces_servidor.popitem(last=False)[1].fechar()
+    else:
+        _traces_servidor.move_to_end(caminho)
+    return trace
+
+def _preparar_trace_servidor(destino: str, origem: Optional[str] = None,
+                             paginas: Optional[List[int]] = None,
+                             formato: str = "auto", largura: int = 4) -> Tuple[str, int]:
+    if origem is not None:
+        if formato == "auto":
+            with open(origem, "rb") as arquivo:
+                formato = "compacto" if arquivo.read(len(ASSINATURA_TRACE)) == ASSINATURA_TRACE else "texto"
+        if formato == "compacto":
+            destino = origem
+        elif formato == "binario":
+            gravar_trace_compacto(destino, ler_trace_binario(origem, largura), largura)
+        else:
+            converter_trace_texto(origem, destino)
+    else:
+        maior = max(paginas, default=0)
+        largura = next((bytes_ for bytes_ in sorted(_TIPOS_POR_LARGURA) if maior < 1 << (8 * bytes_)), 8)
+        gravar_trace_compacto(destino, paginas, largura)
+    with TraceCompacto(destino) as trace:
+        return destino, len(trace)
+
+def _executar_lote_servidor(caminho: str, celulas: List[Tuple[str, int]],
+                            max_curva: Optional[int]) -> Tuple[List[Tuple[str, int, int]], Optional[List[int]]]:
+    trace = _trace_servidor(caminho)
+    quadros_lru = [numero_quadros for nome, numero_quadros in celulas if nome == LRU.NOME]
+    curva = curva_falhas_lru(trace) if max_curva is not None or len(quadros_lru) > 1 else None
+    falhas = []
+    for nome, numero_quadros in celulas:
+        if nome == LRU.NOME and curva is not None:
+            falhas.append((nome, numero_quadros, curva.falhas(numero_quadros)))
+        else:
+            algoritmo = obter_politica(nome)(numero_quadros, registrar_historico=False)
+            falhas.append((nome, numero_quadros, algoritmo.executar(trace)))
+    return falhas, curva.curva(max_curva) if max_curva is not None else None
+
+class ServidorSimulacao:
+    
+    def __init__(self, processos: Optional[int] = None, janela_lote: float = 0.005):
+        import tempfile
+        from concurrent.futures import ProcessPoolExecutor
+        
+        self.janela_lote = janela_lote
+        self._pool = ProcessPoolExecutor(max_workers=processos)
+        self._diretorio = tempfile.TemporaryDirectory(prefix="paginacao-")
+        self._registros = 0
+        self.traces = {}
+        self._resultados = {}
+        self._lotes = {}
+        self.lotes_executados = 0
+    
+    async def registrar(self, nome: str, caminho: Optional[str] = None, paginas: Optional[List[int]] = None,
+                        formato: str = "auto", largura: int = 4) -> dict:
+        import asyncio
+        
+        if (caminho is None) == (paginas is None):
+            raise ValueError("informe 'caminho' ou 'paginas'")
+        self._registros += 1
+        destino = os.path.join(self._diretorio.name, f"{self._registros}.pgtr")
+        caminho_compacto, acessos = await asyncio.get_running_loop().run_in_executor(
+            self._pool, _preparar_trace_servidor, destino, caminho, paginas, formato, largura)
+        self.traces[nome] = {"caminho": caminho_compacto, "acessos": acessos}
+        self._resultados[nome] = {}
+        return {"trace": nome, "acessos": acessos}
+    
+    async def simular(self, nome_trace: str, algoritmo: str, quadros: Sequence[int],
+                      curva=None) -> dict:
+        import asyncio
+        
+        if nome_trace not in self.traces:
+            raise ValueError(f"Trace não registrado: {nome_trace}")
+        obter_politica(algoritmo)
+        quadros = [int(numero_quadros) for numero_quadros in quadros]
+        if any(numero_quadros < 1 for numero_quadros in quadros):
+            raise ValueError("os números de quadros devem ser pelo menos 1")
+        max_curva = None
+        if curva is True:
+            max_curva = max(quadros, default=0)
+        elif curva:
+            max_curva = int(curva)
+        
+        resultados = dict(self._resultados[nome_trace])
+        faltando = [(algoritmo, numero_quadros) for numero_quadros in quadros
+                    if (algoritmo, numero_quadros) not in resultados]
+        valores_curva = None
+        if faltando or max_curva is not None:
+            futuro = asyncio.get_running_loop().create_future()
+            lote = self._lotes.setdefault(nome_trace, [])
+            lote.append((faltando, max_curva, futuro))
+            if len(lote) == 1:
+                asyncio.get_running_loop().call_later(self.janela_lote, self._disparar_lote, nome_trace)
+            calculados, valores_curva = await futuro
+            resultados.update(calculados)
+        
+        acessos = self.traces[nome_trace]["acessos"]
+        resposta = {
+            "trace": nome_trace,
+            "algoritmo": algoritmo,
+            "acessos": acessos,
+            "resultados": [{
+                "quadros": numero_quadros,
+                "falhas": resultados[(algoritmo, numero_quadros)],
+                "taxa_falhas": resultados[(algoritmo, numero_quadros)] / acessos if acessos else 0.0,
+            } for numero_quadros in quadros],
+        }
+        if max_curva is not None:
+            resposta["curva_lru"] = valores_curva[:max_curva + 1]
+        return resposta
+    
+    def _disparar_lote(self, nome_trace: str):
+        import asyncio
+        
+        lote = self._lotes.pop(nome_trace, [])
+        if lote:
+            asyncio.ensure_future(self._executar_lote(nome_trace, lote))
+    
+    async def _executar_lote(self, nome_trace: str, lote: list):
+        import asyncio
+        
+        celulas = sorted({celula for faltando, _, _ in lote for celula in faltando})
+        maximos = [max_curva for _, max_curva, _ in lote if max_curva is not None]
+        max_curva = max(maximos) if maximos else None
+        celulas_lru = [celula for celula in celulas if celula[0] == LRU.NOME]
+        if max_curva is not None or len(celulas_lru) > 1:
+            partes = [(celulas_lru, max_curva)]
+            celulas = [celula for celula in celulas if celula[0] != LRU.NOME]
+        else:
+            partes = []
+        partes.extend(([celula], None) for celula in celulas)
+        caminho = self.traces[nome_trace]["caminho"]
+        resultados = self._resultados[nome_trace]
+        laco = asyncio.get_running_loop()
+        try:
+            respostas = await asyncio.gather(*(
+                laco.run_in_executor(self._pool, _executar_lote_servidor, caminho, celulas_parte, max_curva_parte)
+                for celulas_parte, max_curva_parte in partes))
+        except Exception as erro:
+            for _, _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(erro)
+            return
+        self.lotes_executados += 1
+        calculados = {(nome, numero_quadros): quantidade
+                      for falhas, _ in respostas for nome, numero_quadros, quantidade in falhas}
+        valores_curva = next((curva for _, curva in respostas if curva is not None), None)
+        resultados.update(calculados)
+        for _, _, futuro in lote:
+            if not futuro.done():
+                futuro.set_result((calculados, valores_curva))
+    
+    async def _despachar(self, pedido: dict) -> dict:
+        operacao = pedido.get("op")
+        if operacao == "simular":
+            quadros = pedido.get("quadros", [8])
+            if isinstance(quadros, int):
+                quadros = [quadros]
+            return await self.simular(pedido["trace"], pedido["algoritmo"], quadros, pedido.get("curva"))
+        if operacao == "registrar":
+            return await self.registrar(pedido["nome"], pedido.get("caminho"), pedido.get("paginas"),
+                                        pedido.get("formato", "auto"), pedido.get("largura", 4))
+        if operacao == "listar":
+            return {"traces": {nome: dados["acessos"] for nome, dados in self.traces.items()},
+                    "algoritmos": listar_politicas()}
+        raise ValueError(f"Operação desconhecida: {operacao}")
+    
+    async def _responder(self, linha: bytes, escritor):
+        import json
+        
+        identificador = None
+        try:
+            pedido = json.loads(linha)
+            if not isinstance(pedido, dict):
+                raise ValueError("o pedido deve ser um objeto JSON")
+            identificador = pedido.get("id")
+            resposta = await self._despachar(pedido)
+            resposta["ok"] = True
+        except Exception as erro:
+            resposta = {"ok": False, "erro": str(erro) if not isinstance(erro, KeyError) else f"campo ausente: {erro}"}
+        if identificador is not None:
+            resposta["id"] = identificador
+        escritor.write(json.dumps(resposta).encode() + b"\n")
+        await escritor.drain()
+    
+    async def _atender_conexao(self, leitor, escritor):
+        import asyncio
+        
+        pendentes = set()
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                if not linha.strip():
+                    continue
+                tarefa = asyncio.ensure_future(self._responder(linha, escritor))
+                pendentes.add(tarefa)
+                tarefa.add_done_callback(pendentes.discard)
+            if pendentes:
+                await asyncio.gather(*pendentes, return_exceptions=True)
+        except asyncio.CancelledError:
+            for tarefa in pendentes:
+                tarefa.cancel()
+        finally:
+            escritor.close()
+    
+    async def atender(self, endereco: str):
+        import asyncio
+        
+        host, _, porta = endereco.rpartition(":")
+        limite = 1 << 26
+        if porta.isdigit() and os.sep not in endereco:
+            servidor = await asyncio.start_server(self._atender_conexao, host or "127.0.0.1", int(porta), limit=limite)
+        else:
+            servidor = await asyncio.start_unix_server(self._atender_conexao, endereco, limit=limite)
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            if os.path.exists(endereco):
+                os.unlink(endereco)
+    
+    def fechar(self):
+        self._pool.shutdown(cancel_futures=True)
+        self._diretorio.cleanup()
+
+def executar_servidor(endereco: str, processos: Optional[int] = None):
+    import asyncio
+    
+    async def principal():
+        import signal
+        
+        tarefa = asyncio.current_task()
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, tarefa.cancel)
+        except (NotImplementedError, AttributeError):
+            pass
+        servidor = ServidorSimulacao(processos)
+        try:
+            await servidor.atender(endereco)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            servidor.fechar()
+    
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass
 
 def executar_testes():
     numero_quadros = 8
@@ -203,49 +2768,15 @@ def executar_testes():
         
         resultados_comparacao[nome_sequencia] = {}
         
-        print("\n" + "="*80)
-        print("ALGORITMO FIFO")
-        print("="*80)
-        fifo = FIFO(numero_quadros)
-        if modo_detalhado:
-            fifo.executar(sequencia)
-        else:
-            import sys
-            from io import StringIO
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            fifo.executar(sequencia)
-            sys.stdout = old_stdout
-        fifo.exibir_resultado(pagina_procurada, sequencia)
-        resultados_comparacao[nome_sequencia]['FIFO'] = fifo.numero_paginas_faltantes
-        
-        print("\n" + "="*80)
-        print("ALGORITMO LRU")
-        print("="*80)
-        lru = LRU(numero_quadros)
-        if modo_detalhado:
-            lru.executar(sequencia)
-        else:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            lru.executar(sequencia)
-            sys.stdout = old_stdout
-        lru.exibir_resultado(pagina_procurada, sequencia)
-        resultados_comparacao[nome_sequencia]['LRU'] = lru.numero_paginas_faltantes
-        
-        print("\n" + "="*80)
-        print("ALGORITMO MRU")
-        print("="*80)
-        mru = MRU(numero_quadros)
-        if modo_detalhado:
-            mru.executar(sequencia)
-        else:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            mru.executar(sequencia)
-            sys.stdout = old_stdout
-        mru.exibir_resultado(pagina_procurada, sequencia)
-        resultados_comparacao[nome_sequencia]['MRU'] = mru.numero_paginas_faltantes
+        for classe_algoritmo in REGISTRO_POLITICAS.values():
+            print("\n" + "="*80)
+            print(f"ALGORITMO {classe_algoritmo.NOME}")
+            print("="*80)
+            rastreador = RastreadorConsole() if modo_detalhado else None
+            algoritmo = classe_algoritmo(numero_quadros, rastreador)
+            algoritmo.executar(sequencia)
+            algoritmo.exibir_resultado(pagina_procurada, sequencia)
+            resultados_comparacao[nome_sequencia][classe_algoritmo.NOME] = algoritmo.numero_paginas_faltantes
     
     print("\n" + "="*80)
     print("COMPARAÇÃO GERAL - Page Faults por Algoritmo")
@@ -255,8 +2786,201 @@ def executar_testes():
         for algo, falhas in resultados.items():
             print(f"  {algo}: {falhas} page faults")
         
-        melhor = min(resultados.items(), key=lambda x: x[1])
-        print(f"  → Melhor: {melhor[0]} com {melhor[1]} page faults")
+        otimo = resultados[OPT.NOME]
+        candidatos = {algo: falhas for algo, falhas in resultados.items() if algo != OPT.NOME}
+        melhor = min(candidatos.items(), key=lambda x: x[1])
+        print(f"  → Melhor: {melhor[0]} com {melhor[1]} page faults ({melhor[1] - otimo} acima do ótimo)")
+
+COLUNAS_CLI = ("trace", "algoritmo", "quadros", "acessos", "falhas", "taxa_falhas", "segundos", "em_cache")
+
+COLUNAS_BENCHMARK = ("carga", "politica", "acessos", "quadros", "falhas", "segundos",
+                     "acessos_por_segundo", "pico_memoria_kb")
+
+def _abrir_trace_cli(caminho: str, formato: str, largura: int, pilha: ExitStack) -> Iterable[int]:
+    if formato == "auto":
+        with open(caminho, "rb") as arquivo:
+            formato = "compacto" if arquivo.read(len(ASSINATURA_TRACE)) == ASSINATURA_TRACE else "texto"
+    if formato == "compacto":
+        return pilha.enter_context(TraceCompacto(caminho))
+    if formato == "binario":
+        return pilha.enter_context(closing(ler_trace_binario(caminho, largura)))
+    return pilha.enter_context(closing(ler_trace_texto(caminho)))
+
+def _executar_benchmark_cli(opcoes, algoritmos: List[str]) -> int:
+    inicio = time.perf_counter()
+    resultados = executar_benchmark(tamanhos=opcoes.tamanhos or (10_000, 100_000),
+                                    quadros=opcoes.quadros or (64, 1024),
+                                    politicas=algoritmos,
+                                    cargas=opcoes.cargas,
+                                    repeticoes=opcoes.repeticoes)
+    
+    if opcoes.saida == "json":
+        import json
+        
+        json.dump(resultados, sys.stdout, indent=2)
+        print()
+    elif opcoes.saida == "csv":
+        import csv
+        
+        escritor = csv.DictWriter(sys.stdout, fieldnames=COLUNAS_BENCHMARK, lineterminator="\n")
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    else:
+        exibir_benchmark(resultados)
+    if not opcoes.silencioso:
+        print(f"{len(resultados)} medições em {time.perf_counter() - inicio:.3f} s", file=sys.stderr)
+    
+    if opcoes.baseline is None:
+        return 0
+    if not os.path.exists(opcoes.baseline):
+        salvar_baseline(resultados, opcoes.baseline)
+        if not opcoes.silencioso:
+            print(f"baseline gravada em {opcoes.baseline}", file=sys.stderr)
+        return 0
+    
+    regressoes = comparar_com_baseline(resultados, opcoes.baseline, opcoes.tolerancia)
+    for regressao in regressoes:
+        print(f"regressão: {regressao['carga']} {regressao['politica']} {regressao['acessos']} acessos "
+              f"{regressao['quadros']} quadros: {regressao['motivo']}", file=sys.stderr)
+    if regressoes:
+        return 1
+    if not opcoes.silencioso:
+        print(f"sem regressões em relação a {opcoes.baseline}", file=sys.stderr)
+    return 0
+
+def executar_cli(argumentos: Optional[Sequence[str]] = None) -> int:
+    import argparse
+    
+    def lista_nomes(texto: str) -> List[str]:
+        return [nome for nome in texto.split(",") if nome]
+    
+    def lista_quadros(texto: str) -> List[int]:
+        try:
+            return [int(numero) for numero in texto.split(",") if numero]
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"lista de inteiros inválida: {texto!r}")
+    
+    parser = argparse.ArgumentParser(description="Simulação de algoritmos de paginação")
+    parser.add_argument("traces", nargs="*", help="arquivos de trace")
+    parser.add_argument("-a", "--algoritmos", type=lista_nomes, action="extend", default=None, metavar="NOME[,NOME...]",
+                        help=f"políticas a executar (padrão: todas; disponíveis: {', '.join(listar_politicas())})")
+    parser.add_argument("-f", "--quadros", type=lista_quadros, action="extend", default=None, metavar="N[,N...]",
+                        help="números de quadros (padrão: 8; no --benchmark, 64,1024)")
+    parser.add_argument("-o", "--saida", choices=("tabela", "json", "csv"), default="tabela",
+                        help="formato da saída (padrão: tabela)")
+    parser.add_argument("--formato", choices=("auto", "texto", "binario", "compacto"), default="auto",
+                        help="formato dos arquivos de trace (padrão: auto)")
+    parser.add_argument("--largura", type=int, default=4,
+                        help="bytes por página nos traces binários (padrão: 4)")
+    parser.add_argument("-p", "--processos", type=int, default=None,
+                        help="processos da varredura (padrão: 1, sem abrir um pool) "
+                             "ou do servidor (padrão: número de CPUs)")
+    parser.add_argument("--cache", metavar="DIR", default=None,
+                        help="diretório de um cache de resultados em disco")
+    parser.add_argument("--servidor", metavar="ENDERECO", default=None,
+                        help="em vez de simular, atende pedidos em um socket Unix ou host:porta "
+                             "(ver ServidorSimulacao)")
+    benchmark = parser.add_argument_group("benchmark")
+    benchmark.add_argument("--benchmark", action="store_true",
+                           help="em vez de simular traces, mede a vazão nas cargas sintéticas")
+    benchmark.add_argument("--baseline", metavar="ARQ", default=None,
+                           help="grava a baseline em ARQ se ele não existe; senão compara com ela "
+                                "e sai com código 1 se houver regressão")
+    benchmark.add_argument("--tolerancia", type=float, default=0.2,
+                           help="queda de vazão aceitável na comparação (padrão: 0.2)")
+    benchmark.add_argument("--cargas", type=lista_nomes, action="extend", default=None, metavar="NOME[,NOME...]",
+                           help=f"cargas sintéticas (padrão: todas; disponíveis: {', '.join(CARGAS_SINTETICAS)})")
+    benchmark.add_argument("--tamanhos", type=lista_quadros, action="extend", default=None, metavar="N[,N...]",
+                           help="acessos por trace gerado (padrão: 10000,100000)")
+    benchmark.add_argument("--repeticoes", type=int, default=3,
+                           help="execuções cronometradas por combinação (padrão: 3)")
+    volume = parser.add_mutually_exclusive_group()
+    volume.add_argument("-q", "--silencioso", action="store_true",
+                        help="escreve só os resultados")
+    volume.add_argument("-v", "--detalhado", action="store_true",
+                        help="narra cada execução passo a passo na saída de erro")
+    opcoes = parser.parse_args(argumentos)
+    if opcoes.servidor:
+        executar_servidor(opcoes.servidor, opcoes.processos)
+        return 0
+    if opcoes.benchmark:
+        if opcoes.traces:
+            parser.error("--benchmark usa as cargas sintéticas, não arquivos de trace")
+    elif not opcoes.traces:
+        parser.error("informe ao menos um arquivo de trace (ou --servidor, --benchmark)")
+    elif opcoes.baseline is not None:
+        parser.error("--baseline só vale com --benchmark")
+    
+    algoritmos = opcoes.algoritmos or listar_politicas()
+    try:
+        for nome_algoritmo in algoritmos:
+            obter_politica(nome_algoritmo)
+    except ValueError as erro:
+        parser.error(str(erro))
+    if any(numero_quadros < 1 for numero_quadros in opcoes.quadros or ()):
+        parser.error("os números de quadros devem ser pelo menos 1")
+    
+    if opcoes.benchmark:
+        desconhecidas = [nome for nome in opcoes.cargas or () if nome not in CARGAS_SINTETICAS]
+        if desconhecidas:
+            parser.error(f"cargas desconhecidas: {', '.join(desconhecidas)} "
+                         f"(disponíveis: {', '.join(CARGAS_SINTETICAS)})")
+        if any(tamanho < 1 for tamanho in opcoes.tamanhos or ()) or opcoes.repeticoes < 1:
+            parser.error("--tamanhos e --repeticoes devem ser pelo menos 1")
+        try:
+            return _executar_benchmark_cli(opcoes, algoritmos)
+        except (OSError, ValueError) as erro:
+            print(f"erro: {erro}", file=sys.stderr)
+            return 1
+    if not opcoes.quadros:
+        opcoes.quadros = [8]
+    
+    inicio = time.perf_counter()
+    try:
+        if opcoes.detalhado or (opcoes.cache is None and (opcoes.processos or 1) == 1):
+            resultados = []
+            for caminho in opcoes.traces:
+                for nome_algoritmo in algoritmos:
+                    for numero_quadros in opcoes.quadros:
+                        rastreador = RastreadorConsole(sys.stderr) if opcoes.detalhado else None
+                        with ExitStack() as pilha:
+                            paginas = _abrir_trace_cli(caminho, opcoes.formato, opcoes.largura, pilha)
+                            linha = _executar_celula((caminho, nome_algoritmo, numero_quadros),
+                                                     rastreador, paginas)
+                        linha["em_cache"] = False
+                        resultados.append(linha)
+        else:
+            cache = CacheResultados(opcoes.cache) if opcoes.cache else None
+            with ExitStack() as pilha:
+                traces = {caminho: _abrir_trace_cli(caminho, opcoes.formato, opcoes.largura, pilha)
+                          for caminho in opcoes.traces}
+                resultados = executar_varredura(traces, algoritmos, opcoes.quadros, opcoes.processos or 1, cache)
+    except (OSError, ValueError) as erro:
+        print(f"erro: {erro}", file=sys.stderr)
+        return 1
+    
+    if opcoes.saida == "json":
+        import json
+        
+        json.dump(resultados, sys.stdout, indent=2)
+        print()
+    elif opcoes.saida == "csv":
+        import csv
+        
+        escritor = csv.DictWriter(sys.stdout, fieldnames=COLUNAS_CLI, lineterminator="\n")
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    elif opcoes.silencioso:
+        for linha in resultados:
+            print(f"{linha['trace']} {linha['algoritmo']} {linha['quadros']} {linha['falhas']}")
+    else:
+        exibir_tabela_varredura(resultados)
+    
+    if not opcoes.silencioso:
+        print(f"{len(resultados)} execuções em {time.perf_counter() - inicio:.3f} s", file=sys.stderr)
+    return 0
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(executar_cli())
     executar_testes()
\ No newline at end of file